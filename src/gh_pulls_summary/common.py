@@ -2,6 +2,9 @@
 Shared constants, exceptions, data models, and utilities used across modules.
 """
 
+import functools
+import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 # Configuration
@@ -29,6 +32,66 @@ def get_github_headers(token: str | None = None) -> dict:
     return headers
 
 
+@functools.lru_cache(maxsize=512)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """
+    Compile a user-supplied regex pattern once per process.
+
+    File filters and JIRA extraction patterns are applied to every PR and
+    fetched file, so compiled patterns are cached by (pattern, flags) instead
+    of being re-parsed on each call. Invalid patterns raise re.error (failures
+    are not cached).
+    """
+    return re.compile(pattern, flags)
+
+
+# Backreferences still compile inside a larger alternation but would then
+# refer to another pattern's groups, so those patterns are never merged
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def combine_patterns(
+    patterns: Iterable[str | re.Pattern[str]],
+) -> tuple[re.Pattern[str], ...]:
+    """
+    Merge file filter patterns into a single alternation where possible.
+
+    Filters are tested as "any pattern searches the path", which a single
+    `(?:a)|(?:b)` pattern answers in one regex pass per path instead of one
+    per pattern. Patterns with differing flags, verbose patterns, patterns with
+    backreferences and alternations that do not compile (e.g. repeated group
+    names or global inline flags) are returned unchanged.
+
+    Args:
+        patterns: Regex patterns, compiled or as strings
+
+    Returns:
+        Tuple of compiled patterns, usually of length one
+    """
+    compiled = tuple(compile_pattern(p) if isinstance(p, str) else p for p in patterns)
+    return _combine_compiled(compiled)
+
+
+@functools.lru_cache(maxsize=64)
+def _combine_compiled(
+    patterns: tuple[re.Pattern[str], ...],
+) -> tuple[re.Pattern[str], ...]:
+    if len(patterns) < 2:
+        return patterns
+    flags = {p.flags for p in patterns}
+    if len(flags) > 1:
+        return patterns
+    flag = flags.pop()
+    # A verbose-mode comment would swallow the rest of the alternation
+    if flag & re.VERBOSE or any(_BACKREFERENCE.search(p.pattern) for p in patterns):
+        return patterns
+    combined = "|".join(f"(?:{p.pattern})" for p in patterns)
+    try:
+        return (compile_pattern(combined, flag),)
+    except re.error:
+        return patterns
+
+
 # Exception Classes
 
 
@@ -56,7 +119,7 @@ class ValidationError(Exception):
 # Data Models
 
 
-@dataclass
+@dataclass(slots=True)
 class PullRequestData:
     """Data for a single pull request or synthetic JIRA entry in the output table."""
 
@@ -76,7 +139,7 @@ class PullRequestData:
     repo_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class JiraIssueData:
     """Metadata for a JIRA issue used in the output table."""
 
@@ -2,11 +2,15 @@
 GitHub API interaction functions.
 """
 
+import functools
 import logging
 import time
-from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, quote, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from gh_pulls_summary.common import (
     GITHUB_API_BASE,
@@ -16,6 +20,161 @@ from gh_pulls_summary.common import (
     get_github_headers,
 )
 
+# Shared session so consecutive GitHub calls reuse pooled keep-alive
+# connections instead of paying a new TCP/TLS handshake per request. The pool
+# is sized for the concurrent per-PR lookups, and transient gateway errors are
+# retried with backoff before the status checks below see the final response.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            connect=0,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# Maximum number of pages fetched concurrently once the last page is known.
+# The page pool is shared by every request, including those made from the
+# per-PR workers in main.py, so at most MAX_FETCH_WORKERS first-page requests
+# plus MAX_PAGE_WORKERS page requests are in flight, within pool_maxsize above.
+MAX_PAGE_WORKERS = 4
+_page_executor = ThreadPoolExecutor(
+    max_workers=MAX_PAGE_WORKERS, thread_name_prefix="github-page"
+)
+
+
+def _request_page(endpoint, url, params, headers, max_retries):
+    """
+    Fetches a single GitHub API page, waiting out primary rate limits.
+    Returns (results, links) where links is the parsed Link header.
+    """
+    # Retry loop for rate limiting
+    retry_count = 0
+    while retry_count <= max_retries:
+        try:
+            response = _session.get(url, headers=headers, params=params, timeout=30)
+        except requests.exceptions.ConnectionError as e:
+            raise NetworkError(
+                f"Network connection failed. Please check your internet connection and try again. Details: {e}"
+            )
+        except requests.exceptions.Timeout as e:
+            raise NetworkError(
+                f"Request timed out. The GitHub API may be slow. Please try again. Details: {e}"
+            )
+        except requests.exceptions.RequestException as e:
+            raise NetworkError(
+                f"Network error occurred while contacting GitHub API. Details: {e}"
+            )
+
+        # Handle rate limiting with automatic retry
+        if (
+            response.status_code == 403
+            and "X-RateLimit-Remaining" in response.headers
+            and response.headers["X-RateLimit-Remaining"] == "0"
+        ):
+            if retry_count >= max_retries:
+                reset_time = response.headers.get("X-RateLimit-Reset", "unknown")
+                raise RateLimitError(
+                    f"GitHub API rate limit exceeded after {max_retries} retries. "
+                    f"Rate limit will reset at {reset_time}. "
+                    f"Consider using a GitHub token to increase your rate limit (5000 requests/hour vs 60 requests/hour). "
+                    f"Use --github-token or set GITHUB_TOKEN environment variable with a personal access token."
+                )
+
+            # Parse reset time and calculate wait duration
+            reset_timestamp = int(response.headers.get("X-RateLimit-Reset", 0))
+            current_timestamp = int(time.time())
+            wait_seconds = max(
+                reset_timestamp - current_timestamp + 1, 1
+            )  # Add 1 second buffer
+
+            # Convert timestamps to human-readable format for logging
+            from datetime import datetime
+
+            reset_datetime = datetime.fromtimestamp(reset_timestamp)
+            current_datetime = datetime.fromtimestamp(current_timestamp)
+
+            logging.warning(
+                f"Rate limit exceeded. "
+                f"Current time: {current_timestamp} ({current_datetime.isoformat()}), "
+                f"Reset time: {reset_timestamp} ({reset_datetime.isoformat()}), "
+                f"Wait duration: {wait_seconds} seconds ({wait_seconds / 60:.1f} minutes) "
+                f"(retry {retry_count + 1}/{max_retries})..."
+            )
+            time.sleep(wait_seconds)
+            retry_count += 1
+            continue  # Retry the request
+
+        # If we got here, we didn't hit rate limit, so break out of retry loop
+        break
+
+    if response.status_code == 401:
+        raise GitHubAPIError(
+            "GitHub API authentication failed. Please check your --github-token or GITHUB_TOKEN if set. "
+            "You may need to generate a new personal access token from GitHub Settings.",
+            status_code=401,
+            response_text=response.text,
+        )
+
+    if response.status_code == 404:
+        raise GitHubAPIError(
+            f"GitHub API endpoint not found: {endpoint}. "
+            f"Please verify the repository owner and name are correct.",
+            status_code=404,
+            response_text=response.text,
+        )
+
+    if response.status_code != 200:
+        raise GitHubAPIError(
+            f"GitHub API request failed with status {response.status_code}. "
+            f"Endpoint: {endpoint}. "
+            f"Response: {response.text}",
+            status_code=response.status_code,
+            response_text=response.text,
+        )
+
+    try:
+        results = response.json()
+    except ValueError as e:
+        raise GitHubAPIError(
+            f"Invalid JSON response from GitHub API. The service may be experiencing issues. Details: {e}"
+        )
+
+    # Pagination links parsed from the Link header (empty when there is none)
+    return results, response.links
+
+
+def _link_page_number(link):
+    """Returns the page number named by a parsed Link header entry, if any."""
+    if not link:
+        return None
+    pages = parse_qs(urlsplit(link.get("url", "")).query).get("page")
+    try:
+        return int(pages[0]) if pages else None
+    except ValueError:
+        return None
+
+
+def _request_pages(endpoint, url, params, headers, *, max_retries, page_numbers):
+    """
+    Fetches the given page numbers concurrently.
+    Returns each page's results in page order.
+    """
+
+    def request(page_number):
+        page_params = {**params, "page": page_number}
+        return _request_page(endpoint, url, page_params, headers, max_retries)[0]
+
+    return list(_page_executor.map(request, page_numbers))
+
 
 def github_api_request(
     endpoint, params=None, use_paging=True, max_retries=3, headers=None
@@ -50,97 +209,7 @@ def github_api_request(
         url = f"{GITHUB_API_BASE}{endpoint}"
         logging.debug(f"Making API request to {url} with params {params}")
 
-        # Retry loop for rate limiting
-        retry_count = 0
-        while retry_count <= max_retries:
-            try:
-                response = requests.get(url, headers=headers, params=params, timeout=30)
-            except requests.exceptions.ConnectionError as e:
-                raise NetworkError(
-                    f"Network connection failed. Please check your internet connection and try again. Details: {e}"
-                )
-            except requests.exceptions.Timeout as e:
-                raise NetworkError(
-                    f"Request timed out. The GitHub API may be slow. Please try again. Details: {e}"
-                )
-            except requests.exceptions.RequestException as e:
-                raise NetworkError(
-                    f"Network error occurred while contacting GitHub API. Details: {e}"
-                )
-
-            # Handle rate limiting with automatic retry
-            if (
-                response.status_code == 403
-                and "X-RateLimit-Remaining" in response.headers
-                and response.headers["X-RateLimit-Remaining"] == "0"
-            ):
-                if retry_count >= max_retries:
-                    reset_time = response.headers.get("X-RateLimit-Reset", "unknown")
-                    raise RateLimitError(
-                        f"GitHub API rate limit exceeded after {max_retries} retries. "
-                        f"Rate limit will reset at {reset_time}. "
-                        f"Consider using a GitHub token to increase your rate limit (5000 requests/hour vs 60 requests/hour). "
-                        f"Use --github-token or set GITHUB_TOKEN environment variable with a personal access token."
-                    )
-
-                # Parse reset time and calculate wait duration
-                reset_timestamp = int(response.headers.get("X-RateLimit-Reset", 0))
-                current_timestamp = int(time.time())
-                wait_seconds = max(
-                    reset_timestamp - current_timestamp + 1, 1
-                )  # Add 1 second buffer
-
-                # Convert timestamps to human-readable format for logging
-                from datetime import datetime
-
-                reset_datetime = datetime.fromtimestamp(reset_timestamp)
-                current_datetime = datetime.fromtimestamp(current_timestamp)
-
-                logging.warning(
-                    f"Rate limit exceeded. "
-                    f"Current time: {current_timestamp} ({current_datetime.isoformat()}), "
-                    f"Reset time: {reset_timestamp} ({reset_datetime.isoformat()}), "
-                    f"Wait duration: {wait_seconds} seconds ({wait_seconds / 60:.1f} minutes) "
-                    f"(retry {retry_count + 1}/{max_retries})..."
-                )
-                time.sleep(wait_seconds)
-                retry_count += 1
-                continue  # Retry the request
-
-            # If we got here, we didn't hit rate limit, so break out of retry loop
-            break
-
-        if response.status_code == 401:
-            raise GitHubAPIError(
-                "GitHub API authentication failed. Please check your --github-token or GITHUB_TOKEN if set. "
-                "You may need to generate a new personal access token from GitHub Settings.",
-                status_code=401,
-                response_text=response.text,
-            )
-
-        if response.status_code == 404:
-            raise GitHubAPIError(
-                f"GitHub API endpoint not found: {endpoint}. "
-                f"Please verify the repository owner and name are correct.",
-                status_code=404,
-                response_text=response.text,
-            )
-
-        if response.status_code != 200:
-            raise GitHubAPIError(
-                f"GitHub API request failed with status {response.status_code}. "
-                f"Endpoint: {endpoint}. "
-                f"Response: {response.text}",
-                status_code=response.status_code,
-                response_text=response.text,
-            )
-
-        try:
-            results = response.json()
-        except ValueError as e:
-            raise GitHubAPIError(
-                f"Invalid JSON response from GitHub API. The service may be experiencing issues. Details: {e}"
-            )
+        results, links = _request_page(endpoint, url, params, headers, max_retries)
 
         if results == last_results:  # pragma: no cover
             logging.warning(
@@ -161,6 +230,27 @@ def github_api_request(
         all_results.extend(results)
         last_results = results
 
+        # GitHub omits rel="next" on the final page, so no empty page is
+        # needed to detect the end
+        if "next" not in links:
+            break
+
+        # Once the Link header names the last page, the remaining pages are
+        # independent requests and can be fetched concurrently
+        last_page = _link_page_number(links.get("last"))
+        if last_page is not None and last_page > page + 1:
+            remaining = range(page + 1, last_page + 1)
+            for page_results in _request_pages(
+                endpoint,
+                url,
+                params,
+                headers,
+                max_retries=max_retries,
+                page_numbers=remaining,
+            ):
+                all_results.extend(page_results)
+            break
+
         page += 1
 
     logging.debug(f"Fetched {len(all_results)} items from {endpoint}")
@@ -191,7 +281,8 @@ def fetch_pull_requests(owner, repo, github_token=None, review_requested_for=Non
         query = (
             f"is:pr is:open repo:{owner}/{repo} review-requested:{review_requested_for}"
         )
-        search_params = {"q": query, "per_page": 100}
+        per_page = 100
+        search_params = {"q": query, "per_page": per_page}
         logging.debug(
             f"Filtering pull requests for {owner}/{repo} with review-requested:{review_requested_for}"
         )
@@ -213,6 +304,9 @@ def fetch_pull_requests(owner, repo, github_token=None, review_requested_for=Non
 
             for item in items:
                 matching_pr_numbers.add(item["number"])
+            # A short page is the last one; skip the request for an empty page
+            if len(items) < per_page:
+                break
             page += 1
 
         # Return intersection: PRs that are in both /pulls and search results
@@ -255,10 +349,13 @@ def fetch_reviews(owner, repo, pr_number, github_token=None):
     return github_api_request(endpoint, headers=headers)
 
 
+@functools.lru_cache(maxsize=512)
 def fetch_user_details(username, github_token=None):
     """
     Fetches details for a specific GitHub user.
     Returns None if user is not found (404 error).
+    Results, including None, are cached per (username, token) since the same
+    authors and reviewers recur across PRs; errors are not cached.
     """
     endpoint = f"/users/{username}"
     headers = get_github_headers(github_token)
@@ -310,7 +407,7 @@ def fetch_file_content(owner, repo, file_path, ref, github_token=None):
 
     try:
         url = f"{GITHUB_API_BASE}{endpoint}"
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _session.get(url, headers=headers, params=params, timeout=30)
 
         if response.status_code == 200:
             return response.text
@@ -341,7 +438,7 @@ def fetch_pr_diff(owner, repo, pr_number, github_token=None):
     headers["Accept"] = "application/vnd.github.v3.diff"
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _session.get(url, headers=headers, timeout=30)
     except requests.exceptions.ConnectionError:
         raise NetworkError(
             f"Network connection failed while fetching diff for PR #{pr_number}. Please check your internet connection and try again."
@@ -389,7 +486,7 @@ def get_authenticated_user_info(github_token=None):
     """
     headers = get_github_headers(github_token)
     try:
-        resp = requests.get("https://api.github.com/user", headers=headers, timeout=5)
+        resp = _session.get("https://api.github.com/user", headers=headers, timeout=5)
         if resp.status_code == 200:
             data = resp.json()
             name = data.get("name") or data.get("login")
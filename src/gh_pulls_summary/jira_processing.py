@@ -6,6 +6,7 @@ import logging
 import re
 from typing import Any
 
+from gh_pulls_summary.common import compile_pattern
 from gh_pulls_summary.jira_client import JiraClient, JiraClientError
 
 
@@ -66,7 +67,7 @@ def extract_jira_issue_keys(url_dict: dict, pattern: str) -> list[str]:
 
     issue_keys = set()
     try:
-        regex = re.compile(pattern)
+        regex = compile_pattern(pattern)
         for url in url_dict.values():
             matches = regex.findall(url)
             issue_keys.update(matches)
@@ -109,7 +110,7 @@ def extract_primary_jira_from_metadata(
 
     # Compile the row pattern (case-insensitive)
     try:
-        metadata_row_regex = re.compile(row_pattern, re.IGNORECASE)
+        metadata_row_regex = compile_pattern(row_pattern, re.IGNORECASE)
     except re.error as e:
         logging.warning(f"Invalid metadata row pattern '{row_pattern}': {e}")
         return []
@@ -121,7 +122,7 @@ def extract_primary_jira_from_metadata(
             all_matches = []
             for pattern in patterns:
                 try:
-                    regex = re.compile(pattern)
+                    regex = compile_pattern(pattern)
                     matches = regex.findall(line)
                     if matches:
                         all_matches.extend([str(m) for m in matches])
@@ -206,7 +207,7 @@ def extract_jira_from_file_contents(
 
     for pattern in patterns:
         try:
-            regex = re.compile(pattern)
+            regex = compile_pattern(pattern)
             for content in file_contents:
                 if content:
                     matches = regex.findall(content)
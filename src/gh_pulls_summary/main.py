@@ -2,11 +2,15 @@
 # PYTHON_ARGCOMPLETE_OK
 
 import argparse
+import functools
 import logging
 import os
 import re
 import subprocess
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import Any, cast
 
 import argcomplete
@@ -18,6 +22,8 @@ from gh_pulls_summary.common import (  # noqa: F401
     PullRequestData,
     RateLimitError,
     ValidationError,
+    combine_patterns,
+    compile_pattern,
     get_github_headers,
 )
 from gh_pulls_summary.github_api import (  # noqa: F401
@@ -51,11 +57,20 @@ from gh_pulls_summary.output import (
     validate_sort_column,
 )
 
+# Maximum number of concurrent per-PR GitHub lookups
+MAX_FETCH_WORKERS = 8
 
+# PullRequestData attributes for sort columns whose names differ
+_SORT_ATTRIBUTES = {"author": "author_name"}
+
+
+@functools.lru_cache(maxsize=1)
 def get_repo_and_owner_from_git():
     """
     Retrieves the repository and owner from the local Git configuration.
     Returns a tuple (owner, repo) or (None, None) if not found.
+    The result is cached since argument parsing and repo resolution both
+    need it and each lookup spawns a git subprocess.
     """
     try:
         # Get the remote URL
@@ -68,24 +83,15 @@ def get_repo_and_owner_from_git():
         # Parse the remote URL to extract owner and repo
         if remote_url.startswith("git@"):
             # SSH URL (e.g., git@github.com:owner/repo.git)
-            _, path = remote_url.split(":", 1)
+            path = remote_url.partition(":")[2]
         elif remote_url.startswith("https://"):
-            # HTTPS URL (e.g., https://github.com/owner/repo.git)
-            parts = remote_url.split(
-                "/", 5
-            )  # Split into up to 6 parts: ["https:", "", "domain", "owner", "repo", "extra/path..."]
-            if len(parts) >= 5:
-                path = f"{parts[3]}/{parts[4]}"  # owner/repo
-            else:
-                path = remote_url.split("/", 3)[-1]
+            # HTTPS URL (e.g., https://github.com/owner/repo.git), ignoring any
+            # extra path segments after owner/repo
+            path = "/".join(remote_url.split("/", 5)[3:5])
         else:
             return None, None
 
-        # Remove the `.git` suffix if present
-        if path.endswith(".git"):
-            path = path[:-4]
-
-        owner, repo = path.split("/", 1)
+        owner, repo = path.removesuffix(".git").split("/", 1)
         return owner, repo
     except Exception:  # pragma: no cover
         return None, None
@@ -95,15 +101,11 @@ def parse_arguments():
     """
     Parses command-line arguments for the script.
     """
-    # Get default owner from Git metadata
-    default_owner, _ = get_repo_and_owner_from_git()
-
     parser = argparse.ArgumentParser(
         description="Fetch and summarize GitHub pull requests."
     )
     parser.add_argument(
         "--owner",
-        default=default_owner,
         help="Default repository owner. Used when --repo values don't include 'owner/' prefix.",
     )
     parser.add_argument(
@@ -194,8 +196,10 @@ def parse_arguments():
     parser.add_argument(
         "--jira-include",
         type=str,
-        action="append",
-        help="Always include this JIRA issue in the output, regardless of filters. Useful for marker stories when looking at rankings. Can be specified multiple times.",
+        action="extend",
+        nargs="+",
+        metavar="ISSUE",
+        help="Always include these JIRA issues in the output, regardless of filters. Useful for marker stories when looking at rankings. Accepts several issue keys and can be specified multiple times.",
     )
     parser.add_argument(
         "--jira-metadata-row-pattern",
@@ -217,7 +221,16 @@ def parse_arguments():
 
     # Enable tab completion
     argcomplete.autocomplete(parser)
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    # Default the owner from Git metadata, only spawning git when it is needed:
+    # without --repo, or when some --repo entry has no "owner/" prefix
+    if args.owner is None and (
+        not args.repo or any("/" not in entry for entry in args.repo)
+    ):
+        args.owner, _ = get_repo_and_owner_from_git()
+
+    return args
 
 
 def configure_logging(debug):
@@ -235,10 +248,10 @@ def configure_logging(debug):
 
 def resolve_repos(args) -> list[tuple[str, str]]:
     """Resolve --repo args into (owner, repo) tuples."""
-    default_owner, default_repo = get_repo_and_owner_from_git()
-
     repos_arg = args.repo
     if not repos_arg:
+        # Only the implicit current-repository case needs Git metadata
+        default_owner, default_repo = get_repo_and_owner_from_git()
         owner = args.owner or default_owner
         repo = default_repo
         if owner and repo:
@@ -265,6 +278,25 @@ def resolve_repos(args) -> list[tuple[str, str]]:
     return result
 
 
+def _combine_file_filters(patterns, option):
+    """
+    Merges file filters with combine_patterns, first checking that every
+    string pattern compiles (compile_pattern caches the result for the merge).
+    Raises ValidationError naming the option and pattern if one is invalid.
+    """
+    for pattern in patterns:
+        if isinstance(pattern, str):
+            try:
+                compile_pattern(pattern)
+            except re.error as e:
+                raise ValidationError(
+                    f"Invalid regular expression in {option}: '{pattern}'. "
+                    f"Error: {e}. "
+                    f"Please provide a valid regular expression pattern."
+                )
+    return combine_patterns(patterns)
+
+
 def fetch_and_process_pull_requests(
     owner,
     repo,
@@ -287,6 +319,8 @@ def fetch_and_process_pull_requests(
     Returns a tuple of (pull_requests, jira_issues).
 
     Args:
+        file_include: Regex patterns (compiled or strings); keep PRs touching a matching file
+        file_exclude: Regex patterns (compiled or strings); drop PRs touching a matching file
         jira_issue_patterns: List of regex patterns to extract JIRA issue keys from file contents
         jira_include: List of JIRA issue keys to always include in the output
         jira_metadata_row_pattern: Regex pattern to identify metadata row (case-insensitive)
@@ -317,10 +351,17 @@ def fetch_and_process_pull_requests(
             logging.error("Failed to fetch pull requests")
             return [], {}
 
+    # Compile any string file filters once up front rather than per PR file,
+    # merging each list into one alternation so a path is searched only once
+    if file_include:
+        file_include = _combine_file_filters(file_include, "--file-include")
+    if file_exclude:
+        file_exclude = _combine_file_filters(file_exclude, "--file-exclude")
+
     url_regex_compiled = None
     if url_from_pr_content:
         try:
-            url_regex_compiled = re.compile(url_from_pr_content)
+            url_regex_compiled = compile_pattern(url_from_pr_content)
         except re.error as e:
             raise ValidationError(
                 f"Invalid regular expression in --url-from-pr-content: '{url_from_pr_content}'. "
@@ -341,6 +382,16 @@ def fetch_and_process_pull_requests(
             )
             checkout = None
 
+    # Changed-file lists fetched from the API, shared by JIRA preprocessing,
+    # the file filters and URL extraction so each PR's files are fetched once
+    api_files: dict[int, list[dict[str, Any]] | None] = {}
+
+    def get_api_files(pr_number):
+        """Fetch a PR's changed files from the API at most once."""
+        if pr_number not in api_files:
+            api_files[pr_number] = fetch_pr_files(owner, repo, pr_number, github_token)
+        return api_files[pr_number]
+
     # Preprocessing: Collect all JIRA issue keys and batch fetch metadata
     jira_metadata_cache: dict[str, dict[str, Any]] = {}
     pr_issue_keys_map: dict[int, list[str]] = {}
@@ -384,7 +435,7 @@ def fetch_and_process_pull_requests(
                 else:
                     pr_ref = pr.get("head", {}).get("sha")
                     if pr_ref:
-                        files = fetch_pr_files(owner, repo, pr_number, github_token)
+                        files = get_api_files(pr_number)
                         if files:
                             matching_files = [
                                 file.get("filename", "")
@@ -431,6 +482,8 @@ def fetch_and_process_pull_requests(
             except JiraClientError as e:
                 logging.error(f"Failed to batch fetch JIRA metadata: {e}")
 
+    # Apply draft and file filters first so filtered-out PRs cost no further API calls
+    candidate_prs: list[dict[str, Any]] = []
     for pr in prs:
         pr = cast(dict[str, Any], pr)  # Type cast to fix linter errors
         logging.info(f"Processing PR #{pr['number']} - {pr['title']}")
@@ -443,6 +496,23 @@ def fetch_and_process_pull_requests(
             logging.debug(f"Excluding non-draft PR #{pr['number']}")
             continue
 
+        candidate_prs.append(pr)
+
+    # File filters read changed files from the local checkout where possible;
+    # the remaining PRs' file lists come from the API, so fetch them concurrently
+    if file_include or file_exclude:
+        api_numbers = [
+            pr["number"]
+            for pr in candidate_prs
+            if not (checkout and pr.get("base", {}).get("sha"))
+            and pr["number"] not in api_files
+        ]
+        if len(api_numbers) > 1:
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                list(executor.map(get_api_files, api_numbers))
+
+    selected_prs: list[dict[str, Any]] = []
+    for pr in candidate_prs:
         pr_number = pr["number"]
 
         # Apply file filters if specified
@@ -456,7 +526,7 @@ def fetch_and_process_pull_requests(
                     )
                     file_paths = []
             else:
-                files = fetch_pr_files(owner, repo, pr_number, github_token)
+                files = get_api_files(pr_number)
                 if files is None:
                     logging.warning(
                         f"Failed to fetch files for PR #{pr_number}. File filters will be ignored for this PR. This may be due to network issues or API rate limits."
@@ -486,13 +556,40 @@ def fetch_and_process_pull_requests(
                 )
                 continue
 
+        selected_prs.append(pr)
+
+    def fetch_pr_details(pr):
+        """Fetch the events and reviews for one PR."""
+        pr_number = pr["number"]
+        return (
+            fetch_issue_events(owner, repo, pr_number, github_token),
+            fetch_reviews(owner, repo, pr_number, github_token),
+        )
+
+    def fetch_author_details(login):
+        """Fetch the user details for one PR author."""
+        return fetch_user_details(login, github_token)
+
+    # These lookups are independent network round-trips, so issue them
+    # concurrently; map() yields results in input order. Each distinct author
+    # is looked up once up front, since concurrent calls for the same login
+    # would all miss fetch_user_details' cache.
+    author_logins = list(dict.fromkeys(pr["user"]["login"] for pr in selected_prs))
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        author_results = executor.map(fetch_author_details, author_logins)
+        pr_results = executor.map(fetch_pr_details, selected_prs)
+        authors = dict(zip(author_logins, author_results, strict=True))
+        pr_details = list(pr_results)
+
+    for pr, details in zip(selected_prs, pr_details, strict=True):
+        events, reviews = details
+        pr_number = pr["number"]
         pr_title = pr["title"]
         pr_author = pr["user"]["login"]
         pr_url = pr["html_url"]
 
         # Determine when the PR was last marked as ready for review
         pr_ready_date = None
-        events = fetch_issue_events(owner, repo, pr_number, github_token)
         if events is not None:
             for event in events:
                 if event["event"] == "ready_for_review":
@@ -508,8 +605,8 @@ def fetch_and_process_pull_requests(
 
         pr_ready_date = pr_ready_date.split("T")[0]
 
-        # Fetch author details
-        author_details = fetch_user_details(pr_author, github_token)
+        # Resolve author details
+        author_details = authors[pr_author]
         if author_details is not None:
             author_details = cast(
                 dict[str, Any], author_details
@@ -527,8 +624,7 @@ def fetch_and_process_pull_requests(
             pr_author_name = pr_author
             pr_author_url = f"https://github.com/{pr_author}"
 
-        # Fetch reviews and approvals
-        reviews = fetch_reviews(owner, repo, pr_number, github_token)
+        # Count reviews and approvals
         if reviews is None:
             logging.warning(
                 f"Failed to fetch reviews for PR #{pr_number}. Review counts will be set to 0. This may be due to network issues or API rate limits."
@@ -561,17 +657,23 @@ def fetch_and_process_pull_requests(
                     "submitted_at": submitted_at,
                 }
 
-        states = [data["state"] for data in user_latest_review.values()]
+        # Tally every reviewer's latest state in a single pass
+        state_counts = Counter(data["state"] for data in user_latest_review.values())
         pr_reviews = len(user_latest_review)
-        pr_approvals = sum(1 for s in states if s == "APPROVED")
-        pr_changes = sum(1 for s in states if s == "CHANGES_REQUESTED")
+        pr_approvals = state_counts["APPROVED"]
+        pr_changes = state_counts["CHANGES_REQUESTED"]
 
         # Optionally extract all unique URLs from the PR diff (added lines only), sorted by display text
         pr_body_urls_dict = {}
         if url_regex_compiled:
             base_sha = pr.get("base", {}).get("sha")
+            files = api_files.get(pr_number)
             if checkout and base_sha:
                 diff = checkout.get_diff(base_sha, pr_number)
+            elif files and all("patch" in f or not f.get("changes") for f in files):
+                # Every changed file's patch is already in the files response;
+                # GitHub omits it only for binary or very large files
+                diff = "\n".join(f.get("patch", "") for f in files)
             else:
                 diff = fetch_pr_diff(owner, repo, pr_number, github_token)
             if diff is not None:
@@ -661,7 +763,7 @@ def generate_markdown_output(args):
         file_include = []
         for pattern in args.file_include:
             try:
-                file_include.append(re.compile(pattern))
+                file_include.append(compile_pattern(pattern))
             except re.error as e:
                 raise ValidationError(
                     f"Invalid regular expression in --file-include: '{pattern}'. "
@@ -673,7 +775,7 @@ def generate_markdown_output(args):
         file_exclude = []
         for pattern in args.file_exclude:
             try:
-                file_exclude.append(re.compile(pattern))
+                file_exclude.append(compile_pattern(pattern))
             except re.error as e:
                 raise ValidationError(
                     f"Invalid regular expression in --file-exclude: '{pattern}'. "
@@ -792,26 +894,31 @@ def generate_markdown_output(args):
     output.append(header)
     output.append(separator)
 
-    # Sort by the selected column
-    def sort_key(pr):
-        key = sort_column
-        if key == "urls":
+    # Sort by the selected column. The column-specific key function is chosen
+    # once up front rather than branching on the column name for every PR.
+    if sort_column == "urls":
+
+        def column_key(pr):
             return ",".join(pr.pr_body_urls_dict.keys()) if pr.pr_body_urls_dict else ""
-        if key == "rank":
-            if not pr.rank:
-                return "z" * 100
-            return pr.rank
-        return getattr(pr, key, "")
-
-    # Two-phase sort: first by PR number (ascending) for stable baseline,
-    # then by the requested column (stable sort preserves PR number order for ties)
-    pr_number_sorted = sorted(pull_requests, key=lambda pr: pr.number or 0)
-    sorted_prs = sorted(pr_number_sorted, key=sort_key)
-
-    # Add data rows
-    for pr in sorted_prs:
-        row = create_markdown_table_row(pr, url_column, rank_column, jira_issues)
-        output.append(row)
+
+    elif sort_column == "rank":
+
+        def column_key(pr):
+            return pr.rank if pr.rank else "z" * 100
+
+    else:
+        # "author" is displayed from, and so sorts on, the author's name
+        column_key = attrgetter(_SORT_ATTRIBUTES.get(sort_column, sort_column))
+
+    # Single sort on (column value, PR number): ties on the requested column
+    # fall back to ascending PR number, same as sorting twice with a stable sort
+    sorted_prs = sorted(pull_requests, key=lambda pr: (column_key(pr), pr.number or 0))
+
+    # Add data rows; the list is joined once below rather than concatenated
+    output.extend(
+        create_markdown_table_row(pr, url_column, rank_column, jira_issues)
+        for pr in sorted_prs
+    )
 
     # Close JIRA client session if it was created
     if jira_client:
@@ -881,7 +988,9 @@ def main():
     if args.output_markdown:
         try:
             with open(args.output_markdown, "w", encoding="utf-8") as f:
-                f.write(f"{timestamp_output}\n{markdown_output}\n")
+                # Write the pieces in turn rather than concatenating a second
+                # copy of what may be a large report
+                f.writelines((timestamp_output, "\n", markdown_output, "\n"))
             print(
                 f"Markdown output written to: {args.output_markdown}", file=sys.stderr
             )
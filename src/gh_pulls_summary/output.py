@@ -6,6 +6,10 @@ import logging
 
 from gh_pulls_summary.common import ValidationError
 
+# Columns accepted by --sort-column, in the order they are listed to users
+SORT_COLUMNS = ("date", "title", "author", "changes", "approvals", "urls", "rank")
+_SORT_COLUMN_SET = frozenset(SORT_COLUMNS)
+
 
 def parse_column_titles(args):
     """
@@ -24,8 +28,9 @@ def parse_column_titles(args):
     custom_titles = {}
     if hasattr(args, "column_title") and args.column_title:
         for entry in args.column_title:
-            if "=" in entry:
-                col, val = entry.split("=", 1)
+            # partition splits on the first "=" only and reports whether it was found
+            col, sep, val = entry.partition("=")
+            if sep:
                 col = col.strip().lower()
                 if col in default_titles:
                     custom_titles[col] = val.strip()
@@ -41,20 +46,11 @@ def validate_sort_column(sort_column):
     Validates the sort column and returns it in lowercase.
     Raises ValidationError if invalid.
     """
-    allowed_columns = [
-        "date",
-        "title",
-        "author",
-        "changes",
-        "approvals",
-        "urls",
-        "rank",
-    ]
     sort_column = sort_column.lower()
-    if sort_column not in allowed_columns:
+    if sort_column not in _SORT_COLUMN_SET:
         raise ValidationError(
             f"Invalid sort column: '{sort_column}'. "
-            f"Valid options are: {', '.join(allowed_columns)}. "
+            f"Valid options are: {', '.join(SORT_COLUMNS)}. "
             f"Use --sort-column to specify a valid column name."
         )
     return sort_column
@@ -65,16 +61,14 @@ def create_markdown_table_header(titles, url_column, rank_column):
     Creates the markdown table header and separator rows.
     Returns a tuple of (header_row, separator_row).
     """
-    header = f"| {titles['date']} | {titles['title']} | {titles['author']} | {titles['changes']} | {titles['approvals']} |"
-    separator = "| --- | --- | --- | --- | --- |"
-
+    columns = ["date", "title", "author", "changes", "approvals"]
     if url_column:
-        header = header + f" {titles['urls']} |"
-        separator = separator + " --- |"
-
+        columns.append("urls")
     if rank_column:
-        header = header + f" {titles['rank']} |"
-        separator = separator + " --- |"
+        columns.append("rank")
+
+    header = "| " + " | ".join(titles[col] for col in columns) + " |"
+    separator = "|" + " --- |" * len(columns)
 
     return header, separator
 
@@ -111,7 +105,10 @@ def create_markdown_table_row(pr, url_column, rank_column, jira_issues=None):
         # Handle changes (always show for regular PRs, even if 0)
         changes_text = str(pr.changes)
 
-    row = f"| {pr.date} | {title_link} | {author_link} | {changes_text} | {approvals_text} |"
+    # Collect row fragments and join once at the end
+    parts = [
+        f"| {pr.date} | {title_link} | {author_link} | {changes_text} | {approvals_text} |"
+    ]
 
     if url_column:
         if pr.pr_body_urls_dict:
@@ -122,14 +119,14 @@ def create_markdown_table_row(pr, url_column, rank_column, jira_issues=None):
                     url_links.append(f"[~~{text}~~]({url})")
                 else:
                     url_links.append(f"[{text}]({url})")
-            row = row + f" {' '.join(url_links)} |"
+            parts.append(f" {' '.join(url_links)} |")
         else:
-            row = row + " |"
+            parts.append(" |")
 
     if rank_column:
-        row = row + f" {pr.rank} |"
+        parts.append(f" {pr.rank} |")
 
-    return row
+    return "".join(parts)
 
 
 def generate_timestamp(current_time=None, generator_name=None, generator_url=None):
@@ -2,6 +2,7 @@
 
 import logging
 import os
+import re
 import time
 import unittest
 from typing import Any, cast
@@ -18,6 +19,9 @@ from gh_pulls_summary.main import (
     get_repo_and_owner_from_git,
 )
 
+# Expected format of the PR "date" field (YYYY-MM-DD)
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 # Configure logging for tests
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -73,8 +77,9 @@ class IntegrationTestBase(unittest.TestCase):
                 else {},
             )
             if response.status_code == 200:
-                data = response.json()
-                remaining = data.get("rate", {}).get("remaining", 0)
+                # The remaining core quota is also sent as a header, so the
+                # JSON body does not need to be decoded
+                remaining = int(response.headers.get("X-RateLimit-Remaining", 0))
                 if remaining < 10:
                     raise unittest.SkipTest(
                         f"Rate limit too low ({remaining} remaining). Please wait or use a GitHub token."
@@ -109,20 +114,20 @@ class IntegrationTestBase(unittest.TestCase):
         ]
 
         for field in required_fields:
-            self.assertIn(field, pr_data, f"Missing field: {field}")
+            self.assertTrue(hasattr(pr_data, field), f"Missing field: {field}")
 
         # Validate data types
-        self.assertIsInstance(pr_data["number"], int)
-        self.assertIsInstance(pr_data["reviews"], int)
-        self.assertIsInstance(pr_data["approvals"], int)
-        self.assertIsInstance(pr_data["changes"], int)
+        self.assertIsInstance(pr_data.number, int)
+        self.assertIsInstance(pr_data.reviews, int)
+        self.assertIsInstance(pr_data.approvals, int)
+        self.assertIsInstance(pr_data.changes, int)
 
         # Validate URLs
-        self.assertTrue(pr_data["url"].startswith("https://github.com/"))
-        self.assertTrue(pr_data["author_url"].startswith("https://github.com/"))
+        self.assertTrue(pr_data.url.startswith("https://github.com/"))
+        self.assertTrue(pr_data.author_url.startswith("https://github.com/"))
 
         # Validate date format (YYYY-MM-DD)
-        self.assertRegex(pr_data["date"], r"^\d{4}-\d{2}-\d{2}$")
+        self.assertRegex(pr_data.date, DATE_PATTERN)
 
 
 class TestGitHubApiIntegration(IntegrationTestBase):
@@ -275,7 +280,7 @@ class TestEndToEndIntegration(IntegrationTestBase):
 
         pr = prs[0]
         self.assertPullRequestDataValid(pr)
-        self.assertEqual(pr["number"], pr_number)
+        self.assertEqual(pr.number, pr_number)
 
     def test_draft_filter_real_repo(self):
         """Test draft filtering with real repository."""
@@ -391,8 +396,7 @@ class TestRealWorldScenarios(IntegrationTestBase):
 
         pr = prs[0]
         self.assertPullRequestDataValid(pr)
-        self.assertIn("pr_body_urls_dict", pr)
-        self.assertIsInstance(pr["pr_body_urls_dict"], dict)
+        self.assertIsInstance(pr.pr_body_urls_dict, dict)
 
     def test_sort_functionality_real_repo(self):
         """Test different sort options with real data."""
@@ -2,6 +2,7 @@
 
 import logging
 import os
+import re
 import unittest
 
 from gh_pulls_summary.main import (
@@ -10,6 +11,9 @@ from gh_pulls_summary.main import (
     get_repo_and_owner_from_git,
 )
 
+# Expected format of the PR "date" field (YYYY-MM-DD)
+DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 # Configure logging for tests
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -44,8 +48,9 @@ class SimpleIntegrationTests(unittest.TestCase):
                 "https://api.github.com/rate_limit", headers=headers, timeout=10
             )
             if response.status_code == 200:
-                data = response.json()
-                remaining = data.get("rate", {}).get("remaining", 0)
+                # The remaining core quota is also sent as a header, so the
+                # JSON body does not need to be decoded
+                remaining = int(response.headers.get("X-RateLimit-Remaining", 0))
                 if remaining < 5:
                     raise unittest.SkipTest(
                         f"Rate limit too low ({remaining} remaining). Please wait or use a GitHub token."
@@ -90,9 +95,9 @@ class SimpleIntegrationTests(unittest.TestCase):
 
             pr = prs[0]
             self._validate_pr_structure(pr)
-            self.assertEqual(pr["number"], pr_number)
+            self.assertEqual(pr.number, pr_number)
 
-            print(f"✓ Successfully processed PR #{pr_number}: {pr['title']}")
+            print(f"✓ Successfully processed PR #{pr_number}: {pr.title}")
 
         except Exception as e:
             if "Rate limit exceeded" in str(e):
@@ -195,21 +200,20 @@ class SimpleIntegrationTests(unittest.TestCase):
         ]
 
         for field in required_fields:
-            self.assertIn(field, pr, f"Missing field: {field}")
+            self.assertTrue(hasattr(pr, field), f"Missing field: {field}")
 
         # Validate data types
-        self.assertIsInstance(pr["number"], int)
-        self.assertIsInstance(pr["reviews"], int)
-        self.assertIsInstance(pr["approvals"], int)
-        self.assertIsInstance(pr["changes"], int)
+        self.assertIsInstance(pr.number, int)
+        self.assertIsInstance(pr.reviews, int)
+        self.assertIsInstance(pr.approvals, int)
+        self.assertIsInstance(pr.changes, int)
 
         # Validate URLs
-        self.assertTrue(pr["url"].startswith("https://github.com/"))
-        self.assertTrue(pr["author_url"].startswith("https://github.com/"))
+        self.assertTrue(pr.url.startswith("https://github.com/"))
+        self.assertTrue(pr.author_url.startswith("https://github.com/"))
 
         # Validate date format (YYYY-MM-DD)
-
-        self.assertRegex(pr["date"], r"^\d{4}-\d{2}-\d{2}$")
+        self.assertRegex(pr.date, DATE_PATTERN)
 
 
 if __name__ == "__main__":
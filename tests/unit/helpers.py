@@ -0,0 +1,35 @@
+"""
+Shared builders for the unit tests.
+"""
+
+import argparse
+
+
+def markdown_args(**overrides):
+    """Return generate_markdown_output arguments with test defaults applied."""
+    values = {
+        "owner": "owner",
+        "repo": ["repo"],
+        "draft_filter": None,
+        "debug": False,
+        "pr_number": None,
+        "file_include": None,
+        "file_exclude": None,
+        "url_from_pr_content": None,
+        "column_title": None,
+        "sort_column": "date",
+        "include_rank": False,
+        "jira_issue_pattern": r"(PROJ-\d+)",
+        "jira_include": None,
+        "jira_metadata_row_pattern": r"feature\s*/?\s*initiative",
+        "jira_metadata_row_search_depth": 50,
+        "github_token": None,
+        "jira_url": None,
+        "jira_user": None,
+        "jira_token": None,
+        "jira_rank_field": None,
+        "review_requested_for": None,
+        "output_markdown": None,
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
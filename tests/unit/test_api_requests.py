@@ -1,7 +1,10 @@
-import logging
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
+from gh_pulls_summary import github_api
 from gh_pulls_summary.main import (
     fetch_issue_events,
     fetch_pull_requests,
@@ -10,29 +13,34 @@ from gh_pulls_summary.main import (
     github_api_request,
 )
 
-# Configure logging for tests
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+
+def _page(results, has_next=False):
+    """Build a 200 response for one page, with a Link rel="next" if has_next."""
+    links = {"next": {"url": "next", "rel": "next"}} if has_next else {}
+    return MagicMock(
+        status_code=200, headers={}, links=links, json=MagicMock(return_value=results)
+    )
 
 
 class TestApiRequests(unittest.TestCase):
-    @patch("gh_pulls_summary.github_api.requests.get")
+    def setUp(self):
+        fetch_user_details.cache_clear()
+        self.addCleanup(fetch_user_details.cache_clear)
+
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_github_api_request_with_pagination(self, mock_get):
         # Mock paginated responses
         mock_get.side_effect = [
-            MagicMock(
-                status_code=200, json=MagicMock(return_value=[{"id": 1}, {"id": 2}])
-            ),
-            MagicMock(status_code=200, json=MagicMock(return_value=[{"id": 3}])),
-            MagicMock(status_code=200, json=MagicMock(return_value=[])),
+            _page([{"id": 1}, {"id": 2}], has_next=True),
+            _page([{"id": 3}], has_next=True),
+            _page([]),
         ]
 
         result = github_api_request("/test-endpoint")
         self.assertEqual(len(result), 3)
         self.assertEqual(result, [{"id": 1}, {"id": 2}, {"id": 3}])
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_github_api_request_with_dict_response(self, mock_get):
         # Mock a single dictionary response
         mock_get.return_value = MagicMock(
@@ -42,20 +50,95 @@ class TestApiRequests(unittest.TestCase):
         result = github_api_request("/test-endpoint", use_paging=False)
         self.assertEqual(result, {"key": "value"})
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
+    def test_github_api_request_stops_without_next_link(self, mock_get):
+        mock_get.return_value = MagicMock(
+            status_code=200,
+            headers={},
+            links={},
+            json=MagicMock(return_value=[{"id": 1}]),
+        )
+
+        result = github_api_request("/test-endpoint")
+
+        self.assertEqual(result, [{"id": 1}])
+        mock_get.assert_called_once()
+
+    @patch("gh_pulls_summary.github_api._session.get")
+    def test_github_api_request_fetches_remaining_pages_from_links(self, mock_get):
+        base = "https://api.github.com/test-endpoint?per_page=100"
+
+        def get_page(_url, **kwargs):
+            page = kwargs["params"]["page"]
+            links = {}
+            if page < 4:
+                links = {
+                    "next": {"url": f"{base}&page={page + 1}", "rel": "next"},
+                    "last": {"url": f"{base}&page=4", "rel": "last"},
+                }
+            return MagicMock(
+                status_code=200,
+                headers={},
+                links=links,
+                json=MagicMock(return_value=[{"id": page}]),
+            )
+
+        mock_get.side_effect = get_page
+
+        result = github_api_request("/test-endpoint")
+
+        self.assertEqual(result, [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}])
+        self.assertEqual(
+            sorted(call[1]["params"]["page"] for call in mock_get.call_args_list),
+            [1, 2, 3, 4],
+        )
+
+    @patch("gh_pulls_summary.github_api._session.get")
+    def test_concurrent_requests_share_the_page_pool(self, mock_get):
+        base = "https://api.github.com/test-endpoint?per_page=100"
+        lock = threading.Lock()
+        in_flight = {"pages": 0, "max_pages": 0}
+
+        def get_page(_url, **kwargs):
+            page = kwargs["params"]["page"]
+            if page > 1:
+                with lock:
+                    in_flight["pages"] += 1
+                    in_flight["max_pages"] = max(
+                        in_flight["max_pages"], in_flight["pages"]
+                    )
+                time.sleep(0.01)
+                with lock:
+                    in_flight["pages"] -= 1
+            links = {}
+            if page < 5:
+                links = {
+                    "next": {"url": f"{base}&page={page + 1}", "rel": "next"},
+                    "last": {"url": f"{base}&page=5", "rel": "last"},
+                }
+            response = _page([{"id": page}])
+            response.links = links
+            return response
+
+        mock_get.side_effect = get_page
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda _: github_api_request("/test-endpoint"), range(8))
+            )
+
+        self.assertEqual(results, [[{"id": page} for page in range(1, 6)]] * 8)
+        # Pages beyond the first never exceed the shared page pool, no matter
+        # how many requests run at once
+        self.assertLessEqual(in_flight["max_pages"], github_api.MAX_PAGE_WORKERS)
+
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_issue_events(self, mock_get):
         # Mock paginated responses for issue events
         mock_get.side_effect = [
-            MagicMock(
-                status_code=200,
-                json=MagicMock(return_value=[{"event": "ready_for_review"}]),
-            ),
-            MagicMock(
-                status_code=200, json=MagicMock(return_value=[{"event": "labeled"}])
-            ),
-            MagicMock(
-                status_code=200, json=MagicMock(return_value=[])
-            ),  # No more results
+            _page([{"event": "ready_for_review"}], has_next=True),
+            _page([{"event": "labeled"}], has_next=True),
+            _page([]),  # No more results
         ]
 
         result = fetch_issue_events("owner", "repo", 1)
@@ -63,19 +146,13 @@ class TestApiRequests(unittest.TestCase):
         self.assertEqual(result[0]["event"], "ready_for_review")
         self.assertEqual(result[1]["event"], "labeled")
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_reviews(self, mock_get):
         # Mock paginated responses for reviews
         mock_get.side_effect = [
-            MagicMock(
-                status_code=200, json=MagicMock(return_value=[{"state": "APPROVED"}])
-            ),
-            MagicMock(
-                status_code=200, json=MagicMock(return_value=[{"state": "COMMENTED"}])
-            ),
-            MagicMock(
-                status_code=200, json=MagicMock(return_value=[])
-            ),  # No more results
+            _page([{"state": "APPROVED"}], has_next=True),
+            _page([{"state": "COMMENTED"}], has_next=True),
+            _page([]),  # No more results
         ]
 
         result = fetch_reviews("owner", "repo", 1)
@@ -83,7 +160,7 @@ class TestApiRequests(unittest.TestCase):
         self.assertEqual(result[0]["state"], "APPROVED")
         self.assertEqual(result[1]["state"], "COMMENTED")
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_user_details(self, mock_get):
         # Mock user details response
         mock_get.return_value = MagicMock(
@@ -100,18 +177,26 @@ class TestApiRequests(unittest.TestCase):
         self.assertEqual(result["name"], "John Doe")
         self.assertEqual(result["html_url"], "https://github.com/johndoe")
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
+    def test_fetch_user_details_is_cached(self, mock_get):
+        mock_get.side_effect = [
+            MagicMock(status_code=200, json=MagicMock(return_value={"name": "A"})),
+            MagicMock(status_code=404, text="Not Found"),
+        ]
+
+        self.assertEqual(fetch_user_details("alice"), {"name": "A"})
+        self.assertEqual(fetch_user_details("alice"), {"name": "A"})
+        self.assertIsNone(fetch_user_details("ghost"))
+        self.assertIsNone(fetch_user_details("ghost"))
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_pull_requests(self, mock_get):
         # Mock paginated responses for pull requests
         mock_get.side_effect = [
-            MagicMock(
-                status_code=200,
-                json=MagicMock(return_value=[{"number": 1}, {"number": 2}]),
-            ),
-            MagicMock(status_code=200, json=MagicMock(return_value=[{"number": 3}])),
-            MagicMock(
-                status_code=200, json=MagicMock(return_value=[])
-            ),  # No more results
+            _page([{"number": 1}, {"number": 2}], has_next=True),
+            _page([{"number": 3}], has_next=True),
+            _page([]),  # No more results
         ]
 
         result = fetch_pull_requests("owner", "repo")
@@ -120,7 +205,7 @@ class TestApiRequests(unittest.TestCase):
         self.assertEqual(result[1]["number"], 2)
         self.assertEqual(result[2]["number"], 3)
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_pull_requests_with_review_requested_for(self, mock_get):
         """Test fetch_pull_requests fetches all PRs then filters using Search API intersection."""
         # Mock /pulls response (all PRs)
@@ -140,24 +225,18 @@ class TestApiRequests(unittest.TestCase):
 
         mock_get.side_effect = [
             # First call: /pulls
-            MagicMock(
-                status_code=200, json=MagicMock(return_value=all_prs[0:2])
-            ),  # Page 1
-            MagicMock(
-                status_code=200, json=MagicMock(return_value=[all_prs[2]])
-            ),  # Page 2
-            MagicMock(status_code=200, json=MagicMock(return_value=[])),  # Page 3 empty
+            _page(all_prs[0:2], has_next=True),  # Page 1
+            _page([all_prs[2]], has_next=True),  # Page 2
+            _page([]),  # Page 3 empty
             # Second call: /search/issues
             MagicMock(status_code=200, json=MagicMock(return_value=search_results)),
-            MagicMock(
-                status_code=200, json=MagicMock(return_value={"items": []})
-            ),  # Page 2 empty
         ]
 
         result = fetch_pull_requests("owner", "repo", review_requested_for="testuser")
 
-        # Verify both /pulls and /search/issues were called
-        self.assertGreaterEqual(len(mock_get.call_args_list), 4)
+        # Verify both /pulls and /search/issues were called; the short search
+        # page ends the search without requesting an empty page
+        self.assertEqual(len(mock_get.call_args_list), 4)
 
         # Verify results are intersection of /pulls and search (only 1 and 3)
         self.assertEqual(len(result), 2)
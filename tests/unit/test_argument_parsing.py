@@ -1,12 +1,11 @@
-import logging
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch
 
-from gh_pulls_summary.main import parse_arguments
-
-# Configure logging for tests
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
+from gh_pulls_summary.main import (
+    get_repo_and_owner_from_git,
+    parse_arguments,
+    resolve_repos,
 )
 
 
@@ -39,6 +38,45 @@ class TestArgumentParsing(unittest.TestCase):
         self.assertIsNone(args.draft_filter)
         self.assertFalse(args.debug)
 
+    @patch("sys.argv", ["gh_pulls_summary.py", "--owner", "owner", "--repo", "repo"])
+    @patch("gh_pulls_summary.main.get_repo_and_owner_from_git")
+    def test_parse_arguments_skips_git_when_owner_provided(
+        self, mock_get_repo_and_owner_from_git
+    ):
+        args = parse_arguments()
+        self.assertEqual(args.owner, "owner")
+        mock_get_repo_and_owner_from_git.assert_not_called()
+
+    @patch("sys.argv", ["gh_pulls_summary.py", "--repo", "org/name"])
+    @patch("gh_pulls_summary.main.get_repo_and_owner_from_git")
+    def test_parse_arguments_skips_git_for_qualified_repo(
+        self, mock_get_repo_and_owner_from_git
+    ):
+        args = parse_arguments()
+        self.assertIsNone(args.owner)
+        self.assertEqual(resolve_repos(args), [("org", "name")])
+        mock_get_repo_and_owner_from_git.assert_not_called()
+
+    @patch("sys.argv", ["gh_pulls_summary.py", "--repo", "org/one", "--repo", "two"])
+    @patch(
+        "gh_pulls_summary.main.get_repo_and_owner_from_git",
+        return_value=("mock_owner", "mock_repo"),
+    )
+    def test_parse_arguments_uses_git_owner_for_unqualified_repo(
+        self, mock_get_repo_and_owner_from_git
+    ):
+        args = parse_arguments()
+        self.assertEqual(resolve_repos(args), [("org", "one"), ("mock_owner", "two")])
+        mock_get_repo_and_owner_from_git.assert_called_once()
+
+    @patch("gh_pulls_summary.main.get_repo_and_owner_from_git")
+    def test_resolve_repos_skips_git_for_explicit_repos(
+        self, mock_get_repo_and_owner_from_git
+    ):
+        args = SimpleNamespace(owner="owner", repo=["other/one", "two"])
+        self.assertEqual(resolve_repos(args), [("other", "one"), ("owner", "two")])
+        mock_get_repo_and_owner_from_git.assert_not_called()
+
     @patch("sys.argv", ["gh_pulls_summary.py"])
     @patch(
         "gh_pulls_summary.main.get_repo_and_owner_from_git",
@@ -103,6 +141,24 @@ class TestArgumentParsing(unittest.TestCase):
         self.assertEqual(args.repo, ["repo"])
         self.assertEqual(args.jira_include, ["PROJ-1234", "PROJ-5678"])
 
+    @patch(
+        "sys.argv",
+        [
+            "gh_pulls_summary.py",
+            "--jira-include",
+            "PROJ-1234",
+            "PROJ-5678",
+            "--jira-include",
+            "PROJ-9012",
+            "--owner",
+            "owner",
+        ],
+    )
+    def test_parse_arguments_with_space_separated_jira_include(self):
+        args = parse_arguments()
+        self.assertEqual(args.jira_include, ["PROJ-1234", "PROJ-5678", "PROJ-9012"])
+        self.assertEqual(args.owner, "owner")
+
     @patch(
         "sys.argv",
         [
@@ -154,5 +210,36 @@ class TestArgumentParsing(unittest.TestCase):
         self.assertIsNone(args.review_requested_for)
 
 
+class TestGetRepoAndOwnerFromGit(unittest.TestCase):
+    def setUp(self):
+        get_repo_and_owner_from_git.cache_clear()
+        self.addCleanup(get_repo_and_owner_from_git.cache_clear)
+
+    @patch("gh_pulls_summary.main.subprocess.check_output")
+    def test_git_lookup_is_cached(self, mock_check_output):
+        mock_check_output.return_value = "git@github.com:owner/repo.git\n"
+
+        self.assertEqual(get_repo_and_owner_from_git(), ("owner", "repo"))
+        self.assertEqual(get_repo_and_owner_from_git(), ("owner", "repo"))
+        mock_check_output.assert_called_once()
+
+    @patch("gh_pulls_summary.main.subprocess.check_output")
+    def test_git_remote_url_formats(self, mock_check_output):
+        test_cases = [
+            ("git@github.com:owner/repo.git", ("owner", "repo")),
+            ("git@github.com:owner/repo", ("owner", "repo")),
+            ("https://github.com/owner/repo.git", ("owner", "repo")),
+            ("https://github.com/owner/repo", ("owner", "repo")),
+            ("https://github.com/owner/repo.git/tree/main", ("owner", "repo")),
+            ("https://github.com/owner", (None, None)),
+            ("http://github.com/owner/repo.git", (None, None)),
+        ]
+        for url, expected in test_cases:
+            with self.subTest(url=url):
+                get_repo_and_owner_from_git.cache_clear()
+                mock_check_output.return_value = f"{url}\n"
+                self.assertEqual(get_repo_and_owner_from_git(), expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,3 @@
-import logging
 import unittest
 from unittest.mock import patch
 
@@ -6,11 +5,6 @@ from gh_pulls_summary.main import (
     fetch_and_process_pull_requests,
 )
 
-# Configure logging for tests
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
-)
-
 
 class TestDraftFilter(unittest.TestCase):
     @patch("gh_pulls_summary.main.fetch_pull_requests")
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
 import unittest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import requests
 
@@ -16,37 +17,60 @@ from gh_pulls_summary.main import (
 )
 
 
+def _make_response(status_code, json_data=None, json_error=None, text="", headers=None):
+    """
+    Build a fake HTTP response with the attributes github_api reads.
+
+    A SimpleNamespace is enough here since the code under test only touches
+    status_code, text, headers, links and json().
+    """
+
+    def json():
+        if json_error is not None:
+            raise json_error
+        return json_data
+
+    return SimpleNamespace(
+        status_code=status_code,
+        text=text,
+        headers=headers if headers is not None else {},
+        links={},
+        json=json,
+    )
+
+
 class TestErrorConditions(unittest.TestCase):
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_github_api_request_http_error(self, mock_get):
+    def setUp(self):
+        """Patch the GitHub session once for every test in this class."""
+        patcher = patch("gh_pulls_summary.github_api._session.get")
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+        fetch_user_details.cache_clear()
+        self.addCleanup(fetch_user_details.cache_clear)
+
+    def test_github_api_request_http_error(self):
         """Test github_api_request with HTTP error response."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _make_response(404, text="Not Found")
 
         with self.assertRaises(GitHubAPIError) as ctx:
             github_api_request("/test/endpoint")
 
         self.assertIn("GitHub API endpoint not found", str(ctx.exception))
 
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_github_api_request_json_error(self, mock_get):
+    def test_github_api_request_json_error(self):
         """Test github_api_request when JSON parsing fails."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _make_response(
+            200, json_error=ValueError("Invalid JSON")
+        )
 
         with self.assertRaises(GitHubAPIError) as ctx:
             github_api_request("/test/endpoint")
 
         self.assertIn("Invalid JSON response from GitHub API", str(ctx.exception))
 
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_github_api_request_network_error(self, mock_get):
+    def test_github_api_request_network_error(self):
         """Test github_api_request with network error."""
-        mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
+        self.mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
 
         with self.assertRaises(NetworkError) as ctx:
             github_api_request("/test/endpoint")
@@ -67,17 +91,16 @@ class TestErrorConditions(unittest.TestCase):
 
         self.assertIn("Invalid sort column", str(ctx.exception))
 
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_fetch_user_details_success(self, mock_get):
+    def test_fetch_user_details_success(self):
         """Test fetch_user_details with successful response."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "login": "testuser",
-            "name": "Test User",
-            "html_url": "https://github.com/testuser",
-        }
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _make_response(
+            200,
+            json_data={
+                "login": "testuser",
+                "name": "Test User",
+                "html_url": "https://github.com/testuser",
+            },
+        )
 
         result = fetch_user_details("testuser")
 
@@ -87,35 +110,25 @@ class TestErrorConditions(unittest.TestCase):
             self.assertEqual(result["name"], "Test User")
             self.assertEqual(result["html_url"], "https://github.com/testuser")
 
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_fetch_user_details_404_error(self, mock_get):
+    def test_fetch_user_details_404_error(self):
         """Test fetch_user_details returns None for 404 error."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _make_response(404)
 
         result = fetch_user_details("nonexistent_user")
 
         self.assertIsNone(result)
 
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_fetch_user_details_copilot_user(self, mock_get):
+    def test_fetch_user_details_copilot_user(self):
         """Test fetch_user_details returns None for GitHub Copilot user (common 404 case)."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _make_response(404)
 
         result = fetch_user_details("Copilot")
 
         self.assertIsNone(result)
 
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_fetch_user_details_empty_username(self, mock_get):
+    def test_fetch_user_details_empty_username(self):
         """Test fetch_user_details with empty username."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"login": ""}
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _make_response(200, json_data={"login": ""})
 
         result = fetch_user_details("")
 
@@ -123,64 +136,49 @@ class TestErrorConditions(unittest.TestCase):
         if result is not None:
             self.assertEqual(result["login"], "")
 
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_fetch_user_details_rate_limit_error(self, mock_get):
+    def test_fetch_user_details_rate_limit_error(self):
         """Test fetch_user_details raises RateLimitError for rate limit error."""
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_response.headers = {"X-RateLimit-Remaining": "0"}
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _make_response(
+            403, headers={"X-RateLimit-Remaining": "0"}
+        )
 
         with self.assertRaises(RateLimitError) as ctx:
             fetch_user_details("testuser")
 
         self.assertIn("GitHub API rate limit exceeded", str(ctx.exception))
 
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_fetch_user_details_other_http_error(self, mock_get):
+    def test_fetch_user_details_other_http_error(self):
         """Test fetch_user_details raises GitHubAPIError for other HTTP errors."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        mock_response.headers = {}
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _make_response(500, text="Internal Server Error")
 
         with self.assertRaises(GitHubAPIError) as ctx:
             fetch_user_details("testuser")
 
         self.assertIn("GitHub API request failed", str(ctx.exception))
 
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_fetch_user_details_network_error(self, mock_get):
+    def test_fetch_user_details_network_error(self):
         """Test fetch_user_details raises NetworkError for network errors."""
-        mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
+        self.mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
 
         with self.assertRaises(NetworkError) as ctx:
             fetch_user_details("testuser")
 
         self.assertIn("Network connection failed", str(ctx.exception))
 
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_fetch_user_details_json_parse_error(self, mock_get):
+    def test_fetch_user_details_json_parse_error(self):
         """Test fetch_user_details raises GitHubAPIError when JSON parsing fails."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _make_response(
+            200, json_error=ValueError("Invalid JSON")
+        )
 
         with self.assertRaises(GitHubAPIError) as ctx:
             fetch_user_details("testuser")
 
         self.assertIn("Invalid JSON response", str(ctx.exception))
 
-    @patch("gh_pulls_summary.github_api.requests.get")
-    def test_fetch_user_details_403_without_rate_limit(self, mock_get):
+    def test_fetch_user_details_403_without_rate_limit(self):
         """Test fetch_user_details raises GitHubAPIError for 403 without rate limit headers."""
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_response.headers = {}
-        mock_response.text = "Forbidden"
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _make_response(403, text="Forbidden")
 
         with self.assertRaises(GitHubAPIError) as ctx:
             fetch_user_details("testuser")
@@ -2,185 +2,121 @@ import re
 import unittest
 from unittest.mock import patch
 
+from gh_pulls_summary.common import ValidationError, combine_patterns
 from gh_pulls_summary.local_checkout import LocalCheckoutError
 from gh_pulls_summary.main import fetch_and_process_pull_requests
 
+# PRs returned by the mocked fetch_pull_requests; each test uses a prefix
+_PRS = (
+    {
+        "number": 1,
+        "title": "Fix bug",
+        "user": {"login": "user1"},
+        "html_url": "url1",
+        "draft": False,
+        "created_at": "2025-05-01T12:00:00Z",
+    },
+    {
+        "number": 2,
+        "title": "Add feature",
+        "user": {"login": "user2"},
+        "html_url": "url2",
+        "draft": False,
+        "created_at": "2025-05-02T12:00:00Z",
+    },
+    {
+        "number": 3,
+        "title": "Update docs",
+        "user": {"login": "user3"},
+        "html_url": "url3",
+        "draft": False,
+        "created_at": "2025-05-03T12:00:00Z",
+    },
+)
 
-class TestFetchAndProcessPullRequests(unittest.TestCase):
-    @patch("gh_pulls_summary.main.LocalCheckout")
-    @patch("gh_pulls_summary.main.fetch_pull_requests")
-    @patch("gh_pulls_summary.main.fetch_pr_files")
-    @patch("gh_pulls_summary.main.fetch_issue_events")
-    @patch("gh_pulls_summary.main.fetch_user_details")
-    @patch("gh_pulls_summary.main.fetch_reviews")
-    def test_file_include_filter(
-        self,
-        mock_fetch_reviews,
-        mock_fetch_user_details,
-        mock_fetch_issue_events,
-        mock_fetch_pr_files,
-        mock_fetch_pull_requests,
-        mock_checkout_cls,
-    ):
-        mock_checkout_cls.return_value.ensure_clone.side_effect = LocalCheckoutError(
-            "test"
-        )
-
-        mock_fetch_pull_requests.return_value = [
-            {
-                "number": 1,
-                "title": "Fix bug",
-                "user": {"login": "user1"},
-                "html_url": "url1",
-                "draft": False,
-                "created_at": "2025-05-01T12:00:00Z",
-            },
-            {
-                "number": 2,
-                "title": "Add feature",
-                "user": {"login": "user2"},
-                "html_url": "url2",
-                "draft": False,
-                "created_at": "2025-05-02T12:00:00Z",
-            },
-        ]
 
-        mock_fetch_pr_files.side_effect = [
-            [{"filename": "src/file1.py"}],
-            [{"filename": "docs/readme.md"}],
-        ]
-
-        mock_fetch_issue_events.return_value = []
-        mock_fetch_reviews.return_value = []
-        mock_fetch_user_details.return_value = {
+class TestFetchAndProcessPullRequests(unittest.TestCase):
+    def setUp(self):
+        """Patch the GitHub helpers and local checkout used by every test."""
+        self.mocks = {}
+        for name in (
+            "LocalCheckout",
+            "fetch_pull_requests",
+            "fetch_pr_files",
+            "fetch_issue_events",
+            "fetch_user_details",
+            "fetch_reviews",
+            "fetch_pr_diff",
+        ):
+            patcher = patch(f"gh_pulls_summary.main.{name}")
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # Force the API fallback for changed files
+        checkout = self.mocks["LocalCheckout"].return_value
+        checkout.ensure_clone.side_effect = LocalCheckoutError("test")
+        self.mocks["fetch_issue_events"].return_value = []
+        self.mocks["fetch_reviews"].return_value = []
+        self.mocks["fetch_user_details"].return_value = {
             "name": "User Name",
             "html_url": "user_url",
         }
 
+    def _wire(self, *files_per_pr):
+        """Serve the first len(files_per_pr) PRs, each changing the given files."""
+        self.mocks["fetch_pull_requests"].return_value = [
+            dict(pr) for pr in _PRS[: len(files_per_pr)]
+        ]
+        # Keyed by PR number since file lists may be fetched concurrently
+        files_by_number = {
+            number: [{"filename": name} for name in files]
+            for number, files in enumerate(files_per_pr, start=1)
+        }
+        self.mocks["fetch_pr_files"].side_effect = (
+            lambda _owner, _repo, number, _token: files_by_number[number]
+        )
+
+    def test_file_include_filter(self):
+        self._wire(["src/file1.py"], ["docs/readme.md"])
+
         file_include = [re.compile(r".*\.py$")]
         pull_requests, _ = fetch_and_process_pull_requests(
             "owner", "repo", file_include=file_include
         )
 
-        self.assertEqual(len(pull_requests), 1)
-        self.assertEqual(pull_requests[0].number, 1)
-
-    @patch("gh_pulls_summary.main.LocalCheckout")
-    @patch("gh_pulls_summary.main.fetch_pull_requests")
-    @patch("gh_pulls_summary.main.fetch_pr_files")
-    @patch("gh_pulls_summary.main.fetch_issue_events")
-    @patch("gh_pulls_summary.main.fetch_user_details")
-    @patch("gh_pulls_summary.main.fetch_reviews")
-    def test_file_exclude_filter(
-        self,
-        mock_fetch_reviews,
-        mock_fetch_user_details,
-        mock_fetch_issue_events,
-        mock_fetch_pr_files,
-        mock_fetch_pull_requests,
-        mock_checkout_cls,
-    ):
-        mock_checkout_cls.return_value.ensure_clone.side_effect = LocalCheckoutError(
-            "test"
+        self.assertEqual([pr.number for pr in pull_requests], [1])
+        # The filtered-out PR must not trigger any further per-PR API calls
+        self.mocks["fetch_issue_events"].assert_called_once_with(
+            "owner", "repo", 1, None
         )
+        self.mocks["fetch_reviews"].assert_called_once_with("owner", "repo", 1, None)
 
-        mock_fetch_pull_requests.return_value = [
-            {
-                "number": 1,
-                "title": "Fix bug",
-                "user": {"login": "user1"},
-                "html_url": "url1",
-                "draft": False,
-                "created_at": "2025-05-01T12:00:00Z",
-            },
-            {
-                "number": 2,
-                "title": "Add feature",
-                "user": {"login": "user2"},
-                "html_url": "url2",
-                "draft": False,
-                "created_at": "2025-05-02T12:00:00Z",
-            },
-        ]
+    def test_file_include_filter_with_string_patterns(self):
+        self._wire(["src/file1.py"], ["docs/readme.md"])
 
-        mock_fetch_pr_files.side_effect = [
-            [{"filename": "src/file1.py"}],
-            [{"filename": "docs/readme.md"}],
-        ]
+        file_include = [r".*\.py$"]
+        pull_requests, _ = fetch_and_process_pull_requests(
+            "owner", "repo", file_include=file_include
+        )
 
-        mock_fetch_issue_events.return_value = []
-        mock_fetch_reviews.return_value = []
-        mock_fetch_user_details.return_value = {
-            "name": "User Name",
-            "html_url": "user_url",
-        }
+        self.assertEqual([pr.number for pr in pull_requests], [1])
+
+    def test_file_exclude_filter(self):
+        self._wire(["src/file1.py"], ["docs/readme.md"])
 
         file_exclude = [re.compile(r"docs/.*")]
         pull_requests, _ = fetch_and_process_pull_requests(
             "owner", "repo", file_exclude=file_exclude
         )
 
-        self.assertEqual(len(pull_requests), 1)
-        self.assertEqual(pull_requests[0].number, 1)
-
-    @patch("gh_pulls_summary.main.LocalCheckout")
-    @patch("gh_pulls_summary.main.fetch_pull_requests")
-    @patch("gh_pulls_summary.main.fetch_pr_files")
-    @patch("gh_pulls_summary.main.fetch_issue_events")
-    @patch("gh_pulls_summary.main.fetch_user_details")
-    @patch("gh_pulls_summary.main.fetch_reviews")
-    def test_file_include_and_exclude_filters(
-        self,
-        mock_fetch_reviews,
-        mock_fetch_user_details,
-        mock_fetch_issue_events,
-        mock_fetch_pr_files,
-        mock_fetch_pull_requests,
-        mock_checkout_cls,
-    ):
-        mock_checkout_cls.return_value.ensure_clone.side_effect = LocalCheckoutError(
-            "test"
-        )
-
-        mock_fetch_pull_requests.return_value = [
-            {
-                "number": 1,
-                "title": "Fix bug",
-                "user": {"login": "user1"},
-                "html_url": "url1",
-                "draft": False,
-                "created_at": "2025-05-01T12:00:00Z",
-            },
-            {
-                "number": 2,
-                "title": "Add feature",
-                "user": {"login": "user2"},
-                "html_url": "url2",
-                "draft": False,
-                "created_at": "2025-05-02T12:00:00Z",
-            },
-            {
-                "number": 3,
-                "title": "Update docs",
-                "user": {"login": "user3"},
-                "html_url": "url3",
-                "draft": False,
-                "created_at": "2025-05-03T12:00:00Z",
-            },
-        ]
+        self.assertEqual([pr.number for pr in pull_requests], [1])
 
-        mock_fetch_pr_files.side_effect = [
-            [{"filename": "src/file1.py"}],
-            [{"filename": "docs/readme.md"}],
-            [{"filename": "src/file2.py"}, {"filename": "docs/readme.md"}],
-        ]
-
-        mock_fetch_issue_events.return_value = []
-        mock_fetch_reviews.return_value = []
-        mock_fetch_user_details.return_value = {
-            "name": "User Name",
-            "html_url": "user_url",
-        }
+    def test_file_include_and_exclude_filters(self):
+        self._wire(
+            ["src/file1.py"],
+            ["docs/readme.md"],
+            ["src/file2.py", "docs/readme.md"],
+        )
 
         file_include = [re.compile(r".*\.py$")]
         file_exclude = [re.compile(r"docs/.*")]
@@ -188,10 +124,121 @@ class TestFetchAndProcessPullRequests(unittest.TestCase):
             "owner", "repo", file_include=file_include, file_exclude=file_exclude
         )
 
+        # PR 1 is included, PR 2 and PR 3 are excluded
+        self.assertEqual([pr.number for pr in pull_requests], [1])
+
+    def test_invalid_string_filter_raises_validation_error(self):
+        self._wire(["src/file1.py"])
+
+        for option, kwargs in (
+            ("--file-include", {"file_include": ["("]}),
+            ("--file-exclude", {"file_exclude": [r"\.py$", "("]}),
+        ):
+            with self.subTest(option=option):
+                with self.assertRaises(ValidationError) as ctx:
+                    fetch_and_process_pull_requests("owner", "repo", **kwargs)
+                self.assertIn(
+                    f"Invalid regular expression in {option}: '('",
+                    str(ctx.exception),
+                )
+
+    def test_no_file_filters_skips_file_lookups(self):
+        self._wire(["src/file1.py"])
+
+        pull_requests, _ = fetch_and_process_pull_requests("owner", "repo")
+
         self.assertEqual(len(pull_requests), 1)
+        self.mocks["fetch_pr_files"].assert_not_called()
+        self.mocks["LocalCheckout"].assert_not_called()
+
+    def test_url_extraction_reuses_file_patches(self):
+        self._wire(["src/file1.py"])
+        self.mocks["fetch_pr_files"].side_effect = [
+            [
+                {
+                    "filename": "src/file1.py",
+                    "changes": 1,
+                    "patch": "@@ -0,0 +1 @@\n+# https://issues.example.com/PROJ-1",
+                }
+            ]
+        ]
+
+        pull_requests, _ = fetch_and_process_pull_requests(
+            "owner",
+            "repo",
+            file_include=[r"\.py$"],
+            url_from_pr_content=r"https://issues\.example\.com/[A-Z]+-\d+",
+        )
+
         self.assertEqual(
-            pull_requests[0].number, 1
-        )  # PR 1 is included, PR 2 and PR 3 are excluded
+            pull_requests[0].pr_body_urls_dict,
+            {"PROJ-1": "https://issues.example.com/PROJ-1"},
+        )
+        self.mocks["fetch_pr_diff"].assert_not_called()
+
+    def test_url_extraction_fetches_diff_when_patch_missing(self):
+        self._wire(["src/file1.py"])
+        self.mocks["fetch_pr_files"].side_effect = [
+            [{"filename": "src/file1.py", "changes": 5000}]
+        ]
+        self.mocks["fetch_pr_diff"].return_value = ""
+
+        fetch_and_process_pull_requests(
+            "owner", "repo", file_include=[r"\.py$"], url_from_pr_content=r"http\S+"
+        )
+
+        self.mocks["fetch_pr_diff"].assert_called_once_with("owner", "repo", 1, None)
+
+    def test_shared_author_is_looked_up_once(self):
+        self._wire(["a.py"], ["b.py"], ["c.py"])
+        for pr in self.mocks["fetch_pull_requests"].return_value:
+            pr["user"] = {"login": "user1"}
+
+        pull_requests, _ = fetch_and_process_pull_requests("owner", "repo")
+
+        self.assertEqual([pr.author_name for pr in pull_requests], ["User Name"] * 3)
+        self.mocks["fetch_user_details"].assert_called_once_with("user1", None)
+
+    def test_concurrent_details_keep_pr_order(self):
+        self._wire(["a.py"], ["b.py"], ["c.py"])
+        self.mocks["fetch_user_details"].side_effect = lambda login, _token: {
+            "name": login.upper(),
+            "html_url": f"https://github.com/{login}",
+        }
+
+        pull_requests, _ = fetch_and_process_pull_requests("owner", "repo")
+
+        self.assertEqual([pr.number for pr in pull_requests], [1, 2, 3])
+        self.assertEqual(
+            [pr.author_name for pr in pull_requests], ["USER1", "USER2", "USER3"]
+        )
+
+
+class TestCombinePatterns(unittest.TestCase):
+    def test_patterns_merge_into_one_alternation(self):
+        combined = combine_patterns([r".*\.py$", re.compile(r"docs/.*")])
+
+        # The result is cached, so callers get an immutable tuple
+        self.assertIsInstance(combined, tuple)
+        self.assertEqual(len(combined), 1)
+        for path, expected in (
+            ("src/file1.py", True),
+            ("docs/readme.md", True),
+            ("src/readme.md", False),
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(bool(combined[0].search(path)), expected)
+
+    def test_uncombinable_patterns_are_kept_separate(self):
+        for patterns in (
+            [r"(a)\1", r"b"],
+            [r"(?i)readme", r"docs/"],
+            [re.compile("a", re.IGNORECASE), re.compile("b")],
+            [r"(?P<ext>\.py)$", r"(?P<ext>\.md)$"],
+            [re.compile("a  # letter", re.VERBOSE), re.compile("b", re.VERBOSE)],
+        ):
+            with self.subTest(patterns=patterns):
+                self.assertEqual(len(combine_patterns(patterns)), 2)
 
 
 if __name__ == "__main__":
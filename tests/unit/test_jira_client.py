@@ -5,7 +5,7 @@ Unit tests for JIRA client functionality.
 
 import os
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 
 from gh_pulls_summary.common import JiraIssueData, PullRequestData
 from gh_pulls_summary.jira_client import (
@@ -939,6 +939,84 @@ class TestJiraInclude(unittest.TestCase):
         self.assertIn("browse/PROJ-1234", jira_data.url)
         self.assertIn("PROJ-1234", jira_data.rank)
 
+    @patch.multiple(
+        "gh_pulls_summary.main",
+        fetch_issue_events=DEFAULT,
+        fetch_user_details=DEFAULT,
+        fetch_reviews=DEFAULT,
+    )
+    @patch("gh_pulls_summary.main.LocalCheckout")
+    @patch("gh_pulls_summary.main.fetch_file_content")
+    @patch("gh_pulls_summary.main.fetch_pr_files")
+    @patch("gh_pulls_summary.main.fetch_pull_requests")
+    def test_pr_files_fetched_once_for_preprocessing_and_filters(
+        self,
+        mock_fetch_pull_requests,
+        mock_fetch_pr_files,
+        mock_fetch_file_content,
+        mock_local_checkout,
+        *,
+        fetch_issue_events,
+        fetch_user_details,
+        fetch_reviews,
+    ):
+        """Test that JIRA preprocessing and file filters share one file lookup."""
+        from gh_pulls_summary.jira_client import JiraClient
+        from gh_pulls_summary.local_checkout import LocalCheckoutError
+        from gh_pulls_summary.main import fetch_and_process_pull_requests
+
+        mock_local_checkout.return_value.ensure_clone.side_effect = LocalCheckoutError(
+            "test"
+        )
+        mock_fetch_pull_requests.return_value = [
+            {
+                "number": 1,
+                "title": "Add feature",
+                "user": {"login": "user1"},
+                "html_url": "url1",
+                "draft": False,
+                "created_at": "2025-05-01T12:00:00Z",
+                "body": "",
+                "head": {"sha": "abc123"},
+            }
+        ]
+        fetch_issue_events.return_value = []
+        fetch_reviews.return_value = []
+        fetch_user_details.return_value = {"name": "User", "html_url": "url"}
+        mock_fetch_pr_files.return_value = [{"filename": "docs/feature.md"}]
+        mock_fetch_file_content.return_value = "Tracked in PROJ-1234"
+
+        jira_client = Mock(spec=JiraClient)
+        jira_client.base_url = "https://issues.example.com"
+        jira_client.get_issues_metadata.return_value = {
+            "PROJ-1234": {
+                "fields": {
+                    "issuetype": {"name": "Feature"},
+                    "status": {"name": "In Progress"},
+                    "customfield_12345": "0|i00001",
+                },
+                "_rank_field_id": "customfield_12345",
+            }
+        }
+        jira_client.get_issue_type.return_value = "Feature"
+        jira_client.get_issue_status.return_value = "In Progress"
+        jira_client.extract_rank_value.return_value = "0|i00001"
+
+        pull_requests, _ = fetch_and_process_pull_requests(
+            "owner",
+            "repo",
+            file_include=[r"\.md$"],
+            jira_client=jira_client,
+            jira_issue_patterns=[r"(PROJ-\d+)"],
+            jira_metadata_row_pattern=r"feature\s*/?\s*initiative",
+            jira_metadata_search_depth=50,
+            github_token="test_token",
+        )
+
+        self.assertEqual([pr.number for pr in pull_requests], [1])
+        self.assertIn("PROJ-1234", pull_requests[0].rank)
+        mock_fetch_pr_files.assert_called_once_with("owner", "repo", 1, "test_token")
+
     @patch("gh_pulls_summary.main.fetch_pr_files")
     @patch("gh_pulls_summary.main.fetch_reviews")
     @patch("gh_pulls_summary.main.fetch_user_details")
@@ -1007,8 +1085,7 @@ class TestJiraInclude(unittest.TestCase):
         )
 
         # Verify only one entry (the PR, not a duplicate synthetic entry)
-        self.assertEqual(len(pull_requests), 1)
-        self.assertEqual(pull_requests[0].number, 1)
+        self.assertEqual([pr.number for pr in pull_requests], [1])
         self.assertIn("PROJ-1234", pull_requests[0].rank)
 
     @patch("gh_pulls_summary.main.fetch_reviews")
@@ -1,14 +1,9 @@
 # Generated By: Claude Code (Claude Opus 4.6)
-import logging
 import unittest
 from unittest.mock import MagicMock, patch
 
 from gh_pulls_summary.local_checkout import LocalCheckout, LocalCheckoutError
 
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
-)
-
 
 class TestLocalCheckoutInit(unittest.TestCase):
     @patch(
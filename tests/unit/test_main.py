@@ -1,4 +1,3 @@
-import logging
 import sys
 import unittest
 from datetime import datetime, timezone
@@ -23,14 +22,44 @@ from gh_pulls_summary.main import (
     get_rank_for_pr,
     main,
 )
-
-# Configure logging for tests
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+from tests.unit.helpers import markdown_args
 
 
 class TestMainFunction(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Build the PR rows and markdown shared by the main() tests."""
+        # Read-only PR rows reused by the generate_markdown_output tests
+        cls.feature_pr = PullRequestData(
+            date="2025-05-01",
+            title="Add feature X",
+            number=123,
+            url="https://github.com/owner/repo/pull/123",
+            author_name="John Doe",
+            author_url="https://github.com/johndoe",
+            reviews=2,
+            approvals=2,
+            changes=1,
+            pr_body_urls_dict={},
+        )
+        cls.bug_fix_pr = PullRequestData(
+            date="2025-05-02",
+            title="Fix bug Y",
+            number=124,
+            url="https://github.com/owner/repo/pull/124",
+            author_name="Jane Smith",
+            author_url="https://github.com/janesmith",
+            reviews=1,
+            approvals=1,
+            changes=0,
+            pr_body_urls_dict={},
+        )
+        cls.sample_markdown = (
+            "| Date | Title | Author | Reviews | Approvals |\n"
+            "| --- | --- | --- | --- | --- |\n"
+            "| 2025-05-01 | Add feature X #[123](https://github.com/owner/repo/pull/123) | [John Doe](https://github.com/johndoe) | 3 | 2 |"
+        )
+
     def test_generate_timestamp(self):
         """Test the generate_timestamp function."""
         mock_time = datetime(2025, 5, 14, 15, 12, tzinfo=timezone.utc)
@@ -40,60 +69,15 @@ class TestMainFunction(unittest.TestCase):
     def test_generate_markdown_output(self):
         """Test the generate_markdown_output function."""
 
-        class Args:
-            owner = "owner"
-            repo = ["repo"]
-            draft_filter = None
-            debug = False
-            pr_number = None
-            file_include = None
-            file_exclude = None
-            url_from_pr_content = None
-            column_title = None
-            sort_column = "date"
-            include_rank = False
-            jira_issue_pattern = r"(PROJ-\d+)"
-            jira_include = None
-            jira_metadata_row_pattern = r"feature\s*/?\s*initiative"
-            jira_metadata_row_search_depth = 50
-            github_token = None
-            jira_url = None
-            jira_user = None
-            jira_token = None
-            jira_rank_field = None
-            review_requested_for = None
-
-        args = Args()
+        args = markdown_args()
         # Patch fetch_and_process_pull_requests to avoid network
         with patch(
             "gh_pulls_summary.main.fetch_and_process_pull_requests"
         ) as mock_fetch:
             mock_fetch.return_value = (
                 [
-                    PullRequestData(
-                        date="2025-05-02",
-                        title="Fix bug Y",
-                        number=124,
-                        url="https://github.com/owner/repo/pull/124",
-                        author_name="Jane Smith",
-                        author_url="https://github.com/janesmith",
-                        reviews=1,
-                        approvals=1,
-                        changes=0,
-                        pr_body_urls_dict={},
-                    ),
-                    PullRequestData(
-                        date="2025-05-01",
-                        title="Add feature X",
-                        number=123,
-                        url="https://github.com/owner/repo/pull/123",
-                        author_name="John Doe",
-                        author_url="https://github.com/johndoe",
-                        reviews=2,
-                        approvals=2,
-                        changes=1,
-                        pr_body_urls_dict={},
-                    ),
+                    self.bug_fix_pr,
+                    self.feature_pr,
                 ],
                 {},  # Empty jira_issues dict
             )
@@ -109,48 +93,14 @@ class TestMainFunction(unittest.TestCase):
     def test_generate_markdown_output_with_custom_titles(self):
         """Test generate_markdown_output with custom column titles."""
 
-        class Args:
-            owner = "owner"
-            repo = ["repo"]
-            draft_filter = None
-            debug = False
-            pr_number = None
-            file_include = None
-            file_exclude = None
-            url_from_pr_content = None
-            column_title = ["date=Ready Date", "approvals=Total Approvals"]
-            sort_column = "date"
-            include_rank = False
-            jira_issue_pattern = r"(PROJ-\d+)"
-            jira_include = None
-            jira_metadata_row_pattern = r"feature\s*/?\s*initiative"
-            jira_metadata_row_search_depth = 50
-            github_token = None
-            jira_url = None
-            jira_user = None
-            jira_token = None
-            jira_rank_field = None
-            review_requested_for = None
-
-        args = Args()
+        args = markdown_args(
+            column_title=["date=Ready Date", "approvals=Total Approvals"]
+        )
         with patch(
             "gh_pulls_summary.main.fetch_and_process_pull_requests"
         ) as mock_fetch:
             mock_fetch.return_value = (
-                [
-                    PullRequestData(
-                        date="2025-05-01",
-                        title="Add feature X",
-                        number=123,
-                        url="https://github.com/owner/repo/pull/123",
-                        author_name="John Doe",
-                        author_url="https://github.com/johndoe",
-                        reviews=2,
-                        approvals=2,
-                        changes=1,
-                        pr_body_urls_dict={},
-                    )
-                ],
+                [self.feature_pr],
                 {},  # Empty jira_issues dict
             )
             markdown_output = generate_markdown_output(args)
@@ -164,30 +114,30 @@ class TestMainFunction(unittest.TestCase):
     def test_generate_markdown_output_sort_by_approvals(self):
         """Test generate_markdown_output with sort_column=approvals."""
 
-        class Args:
-            owner = "owner"
-            repo = ["repo"]
-            draft_filter = None
-            debug = False
-            pr_number = None
-            file_include = None
-            file_exclude = None
-            url_from_pr_content = None
-            column_title = None
-            sort_column = "approvals"
-            include_rank = False
-            jira_issue_pattern = r"(PROJ-\d+)"
-            jira_include = None
-            jira_metadata_row_pattern = r"feature\s*/?\s*initiative"
-            jira_metadata_row_search_depth = 50
-            github_token = None
-            jira_url = None
-            jira_user = None
-            jira_token = None
-            jira_rank_field = None
-            review_requested_for = None
-
-        args = Args()
+        args = markdown_args(sort_column="approvals")
+        with patch(
+            "gh_pulls_summary.main.fetch_and_process_pull_requests"
+        ) as mock_fetch:
+            mock_fetch.return_value = (
+                [
+                    self.feature_pr,
+                    self.bug_fix_pr,
+                ],
+                {},  # Empty jira_issues dict
+            )
+            markdown_output = generate_markdown_output(args)
+        expected_output = (
+            "| Date | Title | Author | Change Requested | Approvals 🔽 |\n"
+            "| --- | --- | --- | --- | --- |\n"
+            "| 2025-05-02 | Fix bug Y #[124](https://github.com/owner/repo/pull/124) | [Jane Smith](https://github.com/janesmith) | 0 | 1 of 1 |\n"
+            "| 2025-05-01 | Add feature X #[123](https://github.com/owner/repo/pull/123) | [John Doe](https://github.com/johndoe) | 1 | 2 of 2 |"
+        )
+        self.assertEqual(markdown_output, expected_output)
+
+    def test_generate_markdown_output_sort_by_author(self):
+        """Test generate_markdown_output with sort_column=author sorts by name."""
+
+        args = markdown_args(sort_column="author")
         with patch(
             "gh_pulls_summary.main.fetch_and_process_pull_requests"
         ) as mock_fetch:
@@ -200,10 +150,9 @@ class TestMainFunction(unittest.TestCase):
                         url="https://github.com/owner/repo/pull/123",
                         author_name="John Doe",
                         author_url="https://github.com/johndoe",
-                        reviews=2,
-                        approvals=2,
-                        changes=1,
-                        pr_body_urls_dict={},
+                        reviews=0,
+                        approvals=0,
+                        changes=0,
                     ),
                     PullRequestData(
                         date="2025-05-02",
@@ -212,50 +161,23 @@ class TestMainFunction(unittest.TestCase):
                         url="https://github.com/owner/repo/pull/124",
                         author_name="Jane Smith",
                         author_url="https://github.com/janesmith",
-                        reviews=1,
-                        approvals=1,
+                        reviews=0,
+                        approvals=0,
                         changes=0,
-                        pr_body_urls_dict={},
                     ),
                 ],
-                {},  # Empty jira_issues dict
+                {},
             )
             markdown_output = generate_markdown_output(args)
-        expected_output = (
-            "| Date | Title | Author | Change Requested | Approvals 🔽 |\n"
-            "| --- | --- | --- | --- | --- |\n"
-            "| 2025-05-02 | Fix bug Y #[124](https://github.com/owner/repo/pull/124) | [Jane Smith](https://github.com/janesmith) | 0 | 1 of 1 |\n"
-            "| 2025-05-01 | Add feature X #[123](https://github.com/owner/repo/pull/123) | [John Doe](https://github.com/johndoe) | 1 | 2 of 2 |"
-        )
-        self.assertEqual(markdown_output, expected_output)
+
+        rows = markdown_output.splitlines()[2:]
+        self.assertIn("#[124]", rows[0])
+        self.assertIn("#[123]", rows[1])
 
     def test_generate_markdown_output_sort_tiebreak_by_pr_number(self):
         """Test that PRs with the same sort key are ordered by PR number ascending."""
 
-        class Args:
-            owner = "owner"
-            repo = ["repo"]
-            draft_filter = None
-            debug = False
-            pr_number = None
-            file_include = None
-            file_exclude = None
-            url_from_pr_content = None
-            column_title = None
-            sort_column = "date"
-            include_rank = False
-            jira_issue_pattern = r"(PROJ-\d+)"
-            jira_include = None
-            jira_metadata_row_pattern = r"feature\s*/?\s*initiative"
-            jira_metadata_row_search_depth = 50
-            github_token = None
-            jira_url = None
-            jira_user = None
-            jira_token = None
-            jira_rank_field = None
-            review_requested_for = None
-
-        args = Args()
+        args = markdown_args()
         with patch(
             "gh_pulls_summary.main.fetch_and_process_pull_requests"
         ) as mock_fetch:
@@ -323,23 +245,9 @@ class TestMainFunction(unittest.TestCase):
     ):
         """Test the main function."""
         # Mock command-line arguments
-        mock_parse_arguments.return_value = MagicMock(
-            owner="owner",
-            repo="repo",
-            draft_filter=None,
-            debug=False,
-            pr_number=None,
-            file_include=None,
-            file_exclude=None,
-            url_from_pr_content=None,
-            output_markdown=None,
-        )
+        mock_parse_arguments.return_value = markdown_args()
         mock_generate_timestamp.return_value = "**Generated at 2025-05-14 15:12Z**\n"
-        mock_generate_markdown_output.return_value = (
-            "| Date | Title | Author | Reviews | Approvals |\n"
-            "| --- | --- | --- | --- | --- |\n"
-            "| 2025-05-01 | Add feature X #[123](https://github.com/owner/repo/pull/123) | [John Doe](https://github.com/johndoe) | 3 | 2 |"
-        )
+        mock_generate_markdown_output.return_value = self.sample_markdown
         # Patch print to capture output
         with patch("builtins.print") as mock_print:
             main()
@@ -368,14 +276,7 @@ class TestMainFunction(unittest.TestCase):
         mock_exit.side_effect = SystemExit(1)
 
         # Mock command-line arguments with no owner or repo
-        mock_parse_arguments.return_value = MagicMock(
-            owner=None,
-            repo=None,
-            draft_filter=None,
-            debug=False,
-            pr_number=None,
-            output_markdown=None,
-        )
+        mock_parse_arguments.return_value = markdown_args(owner=None, repo=None)
 
         # Call main and check that sys.exit is called
         with self.assertRaises(SystemExit) as ctx:
@@ -400,32 +301,19 @@ class TestMainFunction(unittest.TestCase):
         mock_generate_markdown_output,
     ):
         """Test the main function with --output-markdown argument."""
-        import os
         import tempfile
+        from pathlib import Path
 
-        # Create a temporary file path
-        with tempfile.NamedTemporaryFile(delete=False) as tmpfile:
-            output_path = tmpfile.name
-        try:
-            mock_parse_arguments.return_value = MagicMock(
-                owner="owner",
-                repo="repo",
-                draft_filter=None,
-                debug=False,
-                pr_number=None,
-                file_include=None,
-                file_exclude=None,
-                url_from_pr_content=None,
-                output_markdown=output_path,
+        # Write into a per-test directory that is removed afterwards
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = str(Path(tmpdir) / "summary.md")
+            mock_parse_arguments.return_value = markdown_args(
+                output_markdown=output_path
             )
             mock_generate_timestamp.return_value = (
                 "**Generated at 2025-05-14 15:12Z**\n"
             )
-            mock_generate_markdown_output.return_value = (
-                "| Date | Title | Author | Reviews | Approvals |\n"
-                "| --- | --- | --- | --- | --- |\n"
-                "| 2025-05-01 | Add feature X #[123](https://github.com/owner/repo/pull/123) | [John Doe](https://github.com/johndoe) | 3 | 2 |"
-            )
+            mock_generate_markdown_output.return_value = self.sample_markdown
             # Patch print to capture the informational message
             with patch("builtins.print") as mock_print:
                 main()
@@ -442,8 +330,6 @@ class TestMainFunction(unittest.TestCase):
                 file_content = f.read()
             expected = "**Generated at 2025-05-14 15:12Z**\n\n| Date | Title | Author | Reviews | Approvals |\n| --- | --- | --- | --- | --- |\n| 2025-05-01 | Add feature X #[123](https://github.com/owner/repo/pull/123) | [John Doe](https://github.com/johndoe) | 3 | 2 |\n"
             self.assertEqual(file_content, expected)
-        finally:
-            os.remove(output_path)
 
     @patch("gh_pulls_summary.main.generate_markdown_output")
     @patch("gh_pulls_summary.main.generate_timestamp")
@@ -455,16 +341,8 @@ class TestMainFunction(unittest.TestCase):
         mock_generate_markdown_output,
     ):
         """Test the main function with --url-from-pr-content argument."""
-        mock_parse_arguments.return_value = MagicMock(
-            owner="owner",
-            repo="repo",
-            draft_filter=None,
-            debug=False,
-            pr_number=None,
-            file_include=None,
-            file_exclude=None,
-            url_from_pr_content=r"https://example.com/[^\s]+",
-            output_markdown=None,
+        mock_parse_arguments.return_value = markdown_args(
+            url_from_pr_content=r"https://example.com/[^\s]+"
         )
         mock_generate_timestamp.return_value = "**Generated at 2025-05-14 15:12Z**\n"
         mock_generate_markdown_output.return_value = (
@@ -486,90 +364,36 @@ class TestMainFunction(unittest.TestCase):
     @patch("builtins.print")
     @patch("gh_pulls_summary.main.generate_markdown_output")
     @patch("gh_pulls_summary.main.parse_arguments")
-    def test_main_rate_limit_error(
+    def test_main_reports_errors(
         self, mock_parse, mock_generate, mock_print, mock_exit
     ):
-        """Test main function handles RateLimitError."""
+        """Test main function reports each error type and exits with 1."""
         mock_exit.side_effect = SystemExit(1)
-        mock_parse.return_value = Mock(
-            owner="test", repo="test", debug=False, output_markdown=None
-        )
-        mock_generate.side_effect = RateLimitError("Rate limit exceeded")
-
-        with self.assertRaises(SystemExit):
-            main()
-
-        mock_print.assert_called_with(
-            "ERROR: GitHub API rate limit exceeded. Rate limit exceeded",
-            file=sys.stderr,
-        )
-        mock_exit.assert_called_with(1)
-
-    @patch("gh_pulls_summary.main.sys.exit")
-    @patch("builtins.print")
-    @patch("gh_pulls_summary.main.generate_markdown_output")
-    @patch("gh_pulls_summary.main.parse_arguments")
-    def test_main_github_api_error(
-        self, mock_parse, mock_generate, mock_print, mock_exit
-    ):
-        """Test main function handles GitHubAPIError."""
-        mock_exit.side_effect = SystemExit(1)
-        mock_parse.return_value = Mock(
-            owner="test", repo="test", debug=False, output_markdown=None
-        )
-        mock_generate.side_effect = GitHubAPIError(
-            "API error", status_code=404, response_text="Not found"
-        )
-
-        with self.assertRaises(SystemExit):
-            main()
-
-        mock_print.assert_called_with(
-            "ERROR: GitHub API error. API error", file=sys.stderr
-        )
-        mock_exit.assert_called_with(1)
-
-    @patch("gh_pulls_summary.main.sys.exit")
-    @patch("builtins.print")
-    @patch("gh_pulls_summary.main.generate_markdown_output")
-    @patch("gh_pulls_summary.main.parse_arguments")
-    def test_main_network_error(self, mock_parse, mock_generate, mock_print, mock_exit):
-        """Test main function handles NetworkError."""
-        mock_exit.side_effect = SystemExit(1)
-        mock_parse.return_value = Mock(
-            owner="test", repo="test", debug=False, output_markdown=None
-        )
-        mock_generate.side_effect = NetworkError("Network failed")
-
-        with self.assertRaises(SystemExit):
-            main()
-
-        mock_print.assert_called_with(
-            "ERROR: Network error. Network failed", file=sys.stderr
-        )
-        mock_exit.assert_called_with(1)
-
-    @patch("gh_pulls_summary.main.sys.exit")
-    @patch("builtins.print")
-    @patch("gh_pulls_summary.main.generate_markdown_output")
-    @patch("gh_pulls_summary.main.parse_arguments")
-    def test_main_validation_error(
-        self, mock_parse, mock_generate, mock_print, mock_exit
-    ):
-        """Test main function handles ValidationError."""
-        mock_exit.side_effect = SystemExit(1)
-        mock_parse.return_value = Mock(
-            owner="test", repo="test", debug=False, output_markdown=None
-        )
-        mock_generate.side_effect = ValidationError("Invalid input")
-
-        with self.assertRaises(SystemExit):
-            main()
-
-        mock_print.assert_called_with(
-            "ERROR: Input validation failed. Invalid input", file=sys.stderr
-        )
-        mock_exit.assert_called_with(1)
+        mock_parse.return_value = markdown_args(owner="test", repo=["test"])
+
+        for error, expected in (
+            (
+                RateLimitError("Rate limit exceeded"),
+                "ERROR: GitHub API rate limit exceeded. Rate limit exceeded",
+            ),
+            (
+                GitHubAPIError("API error", status_code=404, response_text="Not found"),
+                "ERROR: GitHub API error. API error",
+            ),
+            (NetworkError("Network failed"), "ERROR: Network error. Network failed"),
+            (
+                ValidationError("Invalid input"),
+                "ERROR: Input validation failed. Invalid input",
+            ),
+        ):
+            with self.subTest(error=type(error).__name__):
+                mock_generate.side_effect = error
+
+                with self.assertRaises(SystemExit):
+                    main()
+
+                mock_print.assert_called_with(expected, file=sys.stderr)
+                mock_exit.assert_called_with(1)
 
 
 class TestGithubApiHelpers(unittest.TestCase):
@@ -602,7 +426,7 @@ class TestGithubApiHelpers(unittest.TestCase):
         self.assertIn("headers", call_args[1])
         self.assertEqual(result, [{"filename": "file1.py"}, {"filename": "file2.py"}])
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_pr_diff(self, mock_requests_get):
         from gh_pulls_summary.main import GitHubAPIError
 
@@ -622,7 +446,7 @@ class TestGithubApiHelpers(unittest.TestCase):
             fetch_pr_diff("owner", "repo", 99)
         self.assertIn("Pull request #99 not found", str(ctx.exception))
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_get_authenticated_user_info_success(self, mock_requests_get):
         """Test get_authenticated_user_info with successful response."""
         # Mock the response
@@ -655,7 +479,7 @@ class TestGithubApiHelpers(unittest.TestCase):
         self.assertEqual(name, "Test User")
         self.assertEqual(html_url, "https://github.com/testuser")
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_get_authenticated_user_info_success_no_name(self, mock_requests_get):
         """Test get_authenticated_user_info with successful response but no name field."""
         # Mock the response with no name field
@@ -677,7 +501,7 @@ class TestGithubApiHelpers(unittest.TestCase):
         self.assertEqual(name, "testuser")
         self.assertEqual(html_url, "https://github.com/testuser")
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_get_authenticated_user_info_failure(self, mock_requests_get):
         """Test get_authenticated_user_info with failed response."""
         # Mock a failed response
@@ -703,10 +527,7 @@ class TestHelperFunctions(unittest.TestCase):
         """Test parse_column_titles with no custom titles."""
         from gh_pulls_summary.main import parse_column_titles
 
-        class Args:
-            column_title = None
-
-        args = Args()
+        args = markdown_args(column_title=None)
         result = parse_column_titles(args)
 
         expected = {
@@ -724,14 +545,13 @@ class TestHelperFunctions(unittest.TestCase):
         """Test parse_column_titles with custom column titles."""
         from gh_pulls_summary.main import parse_column_titles
 
-        class Args:
-            column_title = [
+        args = markdown_args(
+            column_title=[
                 "date=Ready Date",
                 "approvals=Total Approvals",
                 "author=Contributor",
             ]
-
-        args = Args()
+        )
         result = parse_column_titles(args)
 
         expected = {
@@ -749,10 +569,9 @@ class TestHelperFunctions(unittest.TestCase):
         """Test parse_column_titles with invalid column name."""
         from gh_pulls_summary.main import parse_column_titles
 
-        class Args:
-            column_title = ["date=Ready Date", "invalid=Bad Column", "title=PR Title"]
-
-        args = Args()
+        args = markdown_args(
+            column_title=["date=Ready Date", "invalid=Bad Column", "title=PR Title"]
+        )
 
         with patch("gh_pulls_summary.main.logging.warning") as mock_warning:
             result = parse_column_titles(args)
@@ -776,10 +595,9 @@ class TestHelperFunctions(unittest.TestCase):
         """Test parse_column_titles with malformed entries (no equals sign)."""
         from gh_pulls_summary.main import parse_column_titles
 
-        class Args:
-            column_title = ["date=Ready Date", "bad-entry", "title=PR Title"]
-
-        args = Args()
+        args = markdown_args(
+            column_title=["date=Ready Date", "bad-entry", "title=PR Title"]
+        )
         result = parse_column_titles(args)
 
         # Should skip malformed entries
@@ -794,14 +612,25 @@ class TestHelperFunctions(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
+    def test_parse_column_titles_whitespace_and_extra_equals(self):
+        """Test parse_column_titles trims whitespace and splits on the first '=' only."""
+        from gh_pulls_summary.main import parse_column_titles
+
+        args = markdown_args(
+            column_title=["  DATE  =  Ready Date  ", "title=a = b", "author="]
+        )
+        result = parse_column_titles(args)
+
+        self.assertEqual(result["date"], "Ready Date")
+        self.assertEqual(result["title"], "a = b")
+        self.assertEqual(result["author"], "")
+
     def test_parse_column_titles_no_attribute(self):
         """Test parse_column_titles when args doesn't have column_title attribute."""
         from gh_pulls_summary.main import parse_column_titles
 
-        class Args:
-            pass
-
-        args = Args()
+        args = markdown_args()
+        del args.column_title
         result = parse_column_titles(args)
 
         # Should return defaults
@@ -822,23 +651,25 @@ class TestHelperFunctions(unittest.TestCase):
 
         invalid_columns = ["invalid", "foo", "bar"]
         for col in invalid_columns:
-            with self.assertRaises(ValidationError):
+            with self.subTest(col=col), self.assertRaises(ValidationError):
                 validate_sort_column(col)
 
     def test_validate_sort_column_case_insensitive(self):
         """Test validate_sort_column is case insensitive."""
         from gh_pulls_summary.main import validate_sort_column
 
-        result = validate_sort_column("DATE")
-        self.assertEqual(result, "date")
-
-        result = validate_sort_column("Title")
-        self.assertEqual(result, "title")
-
-        result = validate_sort_column("APPROVALS")
-        self.assertEqual(result, "approvals")
+        test_cases = [
+            ("DATE", "date"),
+            ("Title", "title"),
+            ("APPROVALS", "approvals"),
+            ("Urls", "urls"),
+            ("rAnK", "rank"),
+        ]
+        for input_col, expected in test_cases:
+            with self.subTest(input_col=input_col):
+                self.assertEqual(validate_sort_column(input_col), expected)
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_pr_diff(self, mock_get):
         """Test fetch_pr_diff function with error response."""
         from gh_pulls_summary.main import GitHubAPIError
@@ -864,12 +695,7 @@ class TestHelperFunctions(unittest.TestCase):
         mock_exit.side_effect = SystemExit(1)
 
         with patch("gh_pulls_summary.main.parse_arguments") as mock_parse:
-            mock_args = Mock()
-            mock_args.owner = None
-            mock_args.repo = None
-            mock_args.debug = False
-            mock_args.output_markdown = None
-            mock_parse.return_value = mock_args
+            mock_parse.return_value = markdown_args(owner=None, repo=None)
 
             with self.assertRaises(SystemExit) as ctx:
                 main()
@@ -895,54 +721,42 @@ class TestHelperFunctions(unittest.TestCase):
         mock_open,
     ):
         """Test the main function with --output-markdown argument."""
-        import os
-        import tempfile
+        # open() is patched, so the path is only compared, never created
+        temp_filename = "summary.md"
 
-        # Create a temporary file for testing
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_file:
-            temp_filename = temp_file.name
-
-        try:
-            # Mock parse_arguments to return appropriate args
-            mock_args = Mock()
-            mock_args.owner = "test_owner"
-            mock_args.repo = "test_repo"
-            mock_args.output_markdown = temp_filename
-            mock_args.debug = False
-            mock_parse.return_value = mock_args
-
-            # Mock other functions
-            mock_timestamp.return_value = "**Generated at 2023-01-01 12:00Z**"
-            mock_auth.return_value = ("Test User", "https://github.com/test")
-            mock_generate.return_value = (
-                "| Date | Title | Author |\n| --- | --- | --- |"
-            )
+        # Mock parse_arguments to return appropriate args
+        mock_parse.return_value = markdown_args(
+            owner="test_owner", repo=["test_repo"], output_markdown=temp_filename
+        )
 
-            # Mock the file context manager
-            mock_file = Mock()
-            mock_open.return_value.__enter__.return_value = mock_file
+        # Mock other functions
+        mock_timestamp.return_value = "**Generated at 2023-01-01 12:00Z**"
+        mock_auth.return_value = ("Test User", "https://github.com/test")
+        mock_generate.return_value = "| Date | Title | Author |\n| --- | --- | --- |"
 
-            main()
+        # Mock the file context manager
+        mock_file = Mock()
+        mock_open.return_value.__enter__.return_value = mock_file
 
-            # Verify file was opened for writing
-            mock_open.assert_called_once_with(temp_filename, "w", encoding="utf-8")
+        main()
 
-            # Verify content was written to file
-            mock_file.write.assert_called_once()
-            written_content = mock_file.write.call_args[0][0]
-            self.assertIn("**Generated at 2023-01-01 12:00Z**", written_content)
-            self.assertIn("| Date | Title | Author |", written_content)
+        # Verify file was opened for writing
+        mock_open.assert_called_once_with(temp_filename, "w", encoding="utf-8")
 
-            # Verify the new informational message was printed
-            mock_print.assert_called_once_with(
-                f"Markdown output written to: {temp_filename}",
-                file=mock_print.call_args[1]["file"],
-            )
+        # Verify content was written to file
+        mock_file.writelines.assert_called_once()
+        written_content = "".join(mock_file.writelines.call_args[0][0])
+        self.assertEqual(
+            written_content,
+            "**Generated at 2023-01-01 12:00Z**\n"
+            "| Date | Title | Author |\n| --- | --- | --- |\n",
+        )
 
-        finally:
-            # Clean up the temporary file
-            if os.path.exists(temp_filename):
-                os.unlink(temp_filename)
+        # Verify the new informational message was printed
+        mock_print.assert_called_once_with(
+            f"Markdown output written to: {temp_filename}",
+            file=mock_print.call_args[1]["file"],
+        )
 
     def test_create_markdown_table_header_no_url_column(self):
         """Test create_markdown_table_header without URL column."""
@@ -1093,7 +907,7 @@ class TestHelperFunctions(unittest.TestCase):
 class TestFetchFileContent(unittest.TestCase):
     """Test cases for fetch_file_content function."""
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_file_content_success(self, mock_get):
         """Test successful file content fetch."""
         mock_response = Mock()
@@ -1106,7 +920,7 @@ class TestFetchFileContent(unittest.TestCase):
         self.assertEqual(result, "File content here")
         mock_get.assert_called_once()
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_file_content_404(self, mock_get):
         """Test file not found (404)."""
         mock_response = Mock()
@@ -1117,7 +931,7 @@ class TestFetchFileContent(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_file_content_403(self, mock_get):
         """Test access denied or rate limit (403)."""
         mock_response = Mock()
@@ -1128,7 +942,7 @@ class TestFetchFileContent(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_file_content_other_error(self, mock_get):
         """Test other HTTP errors."""
         mock_response = Mock()
@@ -1139,7 +953,7 @@ class TestFetchFileContent(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_file_content_exception(self, mock_get):
         """Test exception handling."""
         mock_get.side_effect = Exception("Network error")
@@ -1148,7 +962,7 @@ class TestFetchFileContent(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_fetch_file_content_special_characters(self, mock_get):
         """Test URL encoding for filenames with special characters like ?."""
         mock_response = Mock()
@@ -1190,6 +1004,17 @@ class TestExtractJiraFunctions(unittest.TestCase):
 
         self.assertEqual(result, [])
 
+    def test_extract_jira_from_file_contents_compiles_pattern_once(self):
+        """Test that a pattern is compiled once and reused across calls."""
+        from gh_pulls_summary.common import compile_pattern
+
+        compile_pattern.cache_clear()
+        for content in ["PR one: PROJ-1", "PR two: PROJ-2"]:
+            extract_jira_from_file_contents([content], [r"(PROJ-\d+)"])
+
+        self.assertEqual(compile_pattern.cache_info().misses, 1)
+        self.assertEqual(compile_pattern.cache_info().hits, 1)
+
 
 class TestGetRankForPR(unittest.TestCase):
     """Test cases for get_rank_for_pr function with closed issue handling."""
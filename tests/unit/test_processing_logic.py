@@ -1,4 +1,3 @@
-import logging
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -8,11 +7,7 @@ from gh_pulls_summary.main import (
     generate_markdown_output,
     generate_timestamp,
 )
-
-# Configure logging for tests
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+from tests.unit.helpers import markdown_args
 
 
 class TestProcessingLogic(unittest.TestCase):
@@ -287,29 +282,6 @@ class TestGenerateMarkdownOutput(unittest.TestCase):
 
     @patch("gh_pulls_summary.main.fetch_and_process_pull_requests")
     def test_generate_markdown_output_with_custom_titles(self, mock_fetch):
-        class Args:
-            owner = "owner"
-            repo = ["repo"]
-            draft_filter = None
-            debug = False
-            pr_number = None
-            file_include = None
-            file_exclude = None
-            url_from_pr_content = None
-            column_title = ["date=Ready Date", "approvals=Total Approvals"]
-            sort_column = "date"
-            include_rank = False
-            jira_issue_pattern = r"(PROJ-\d+)"
-            jira_include = None
-            jira_metadata_row_pattern = r"feature\s*/?\s*initiative"
-            jira_metadata_row_search_depth = 50
-            github_token = None
-            jira_url = None
-            jira_user = None
-            jira_token = None
-            jira_rank_field = None
-            review_requested_for = None
-
         mock_fetch.return_value = (
             [
                 PullRequestData(
@@ -329,7 +301,9 @@ class TestGenerateMarkdownOutput(unittest.TestCase):
         )
         from gh_pulls_summary.main import generate_markdown_output
 
-        args = Args()
+        args = markdown_args(
+            column_title=["date=Ready Date", "approvals=Total Approvals"]
+        )
         markdown_output = generate_markdown_output(args)
         expected_output = (
             "| Ready Date 🔽 | Title | Author | Change Requested | Total Approvals |\n"
@@ -340,29 +314,6 @@ class TestGenerateMarkdownOutput(unittest.TestCase):
 
     @patch("gh_pulls_summary.main.fetch_and_process_pull_requests")
     def test_generate_markdown_output_sort_by_title(self, mock_fetch):
-        class Args:
-            owner = "owner"
-            repo = ["repo"]
-            draft_filter = None
-            debug = False
-            pr_number = None
-            file_include = None
-            file_exclude = None
-            url_from_pr_content = None
-            column_title = None
-            sort_column = "title"
-            include_rank = False
-            jira_issue_pattern = r"(PROJ-\d+)"
-            jira_include = None
-            jira_metadata_row_pattern = r"feature\s*/?\s*initiative"
-            jira_metadata_row_search_depth = 50
-            github_token = None
-            jira_url = None
-            jira_user = None
-            jira_token = None
-            jira_rank_field = None
-            review_requested_for = None
-
         mock_fetch.return_value = (
             [
                 PullRequestData(
@@ -394,7 +345,7 @@ class TestGenerateMarkdownOutput(unittest.TestCase):
         )
         from gh_pulls_summary.main import generate_markdown_output
 
-        args = Args()
+        args = markdown_args(sort_column="title")
         markdown_output = generate_markdown_output(args)
         expected_output = (
             "| Date | Title 🔽 | Author | Change Requested | Approvals |\n"
@@ -12,7 +12,7 @@ class TestRateLimitRetry(unittest.TestCase):
 
     @patch("gh_pulls_summary.github_api.time.sleep")
     @patch("gh_pulls_summary.github_api.time.time")
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_rate_limit_single_retry_success(self, mock_get, mock_time, mock_sleep):
         """Test successful retry after rate limit is hit once."""
         # Set up current time
@@ -47,7 +47,7 @@ class TestRateLimitRetry(unittest.TestCase):
 
     @patch("gh_pulls_summary.github_api.time.sleep")
     @patch("gh_pulls_summary.github_api.time.time")
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_rate_limit_multiple_retries_success(self, mock_get, mock_time, mock_sleep):
         """Test successful retry after multiple rate limits."""
         # Set up current time
@@ -98,7 +98,7 @@ class TestRateLimitRetry(unittest.TestCase):
 
     @patch("gh_pulls_summary.github_api.time.sleep")
     @patch("gh_pulls_summary.github_api.time.time")
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_rate_limit_max_retries_exceeded(self, mock_get, mock_time, mock_sleep):
         """Test that RateLimitError is raised after max retries."""
         # Set up current time
@@ -130,7 +130,7 @@ class TestRateLimitRetry(unittest.TestCase):
 
     @patch("gh_pulls_summary.github_api.time.sleep")
     @patch("gh_pulls_summary.github_api.time.time")
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_rate_limit_wait_time_calculation(self, mock_get, mock_time, mock_sleep):
         """Test that wait time is correctly calculated from reset timestamp."""
         # Current time: 1000
@@ -158,7 +158,7 @@ class TestRateLimitRetry(unittest.TestCase):
 
     @patch("gh_pulls_summary.github_api.time.sleep")
     @patch("gh_pulls_summary.github_api.time.time")
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_rate_limit_minimum_wait_time(self, mock_get, mock_time, mock_sleep):
         """Test that minimum wait time is enforced even if reset is in past."""
         # Current time: 1000
@@ -186,7 +186,7 @@ class TestRateLimitRetry(unittest.TestCase):
 
     @patch("gh_pulls_summary.github_api.time.sleep")
     @patch("gh_pulls_summary.github_api.time.time")
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_no_retry_on_non_rate_limit_403(self, mock_get, mock_time, mock_sleep):
         """Test that 403 without rate limit headers doesn't trigger retry."""
         mock_time.return_value = 1000
@@ -213,7 +213,7 @@ class TestRateLimitRetry(unittest.TestCase):
 
     @patch("gh_pulls_summary.github_api.time.sleep")
     @patch("gh_pulls_summary.github_api.time.time")
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_no_retry_on_403_with_nonzero_remaining(
         self, mock_get, mock_time, mock_sleep
     ):
@@ -246,7 +246,7 @@ class TestRateLimitRetry(unittest.TestCase):
     @patch("gh_pulls_summary.github_api.logging.warning")
     @patch("gh_pulls_summary.github_api.time.sleep")
     @patch("gh_pulls_summary.github_api.time.time")
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_rate_limit_retry_logging(
         self, mock_get, mock_time, mock_sleep, mock_logging
     ):
@@ -281,7 +281,7 @@ class TestRateLimitRetry(unittest.TestCase):
 
     @patch("gh_pulls_summary.github_api.time.sleep")
     @patch("gh_pulls_summary.github_api.time.time")
-    @patch("gh_pulls_summary.github_api.requests.get")
+    @patch("gh_pulls_summary.github_api._session.get")
     def test_rate_limit_with_pagination(self, mock_get, mock_time, mock_sleep):
         """Test rate limit retry works correctly with pagination."""
         mock_time.return_value = 1000
@@ -298,11 +298,13 @@ class TestRateLimitRetry(unittest.TestCase):
         success_response_1 = Mock()
         success_response_1.status_code = 200
         success_response_1.json.return_value = [{"id": 1}, {"id": 2}]
+        success_response_1.links = {"next": {"url": "page=2", "rel": "next"}}
 
         # Third page: empty (end of pagination)
         success_response_2 = Mock()
         success_response_2.status_code = 200
         success_response_2.json.return_value = []
+        success_response_2.links = {}
 
         mock_get.side_effect = [
             rate_limit_response,
@@ -46,8 +46,7 @@ class TestReviewRequestedFilter(unittest.TestCase):
         )
 
         # Verify results - only PR 1 should be included
-        self.assertEqual(len(pull_requests), 1)
-        self.assertEqual(pull_requests[0].number, 1)
+        self.assertEqual([pr.number for pr in pull_requests], [1])
         self.assertEqual(pull_requests[0].title, "Fix bug")
 
         # Verify fetch_pull_requests was called with review_requested_for parameter